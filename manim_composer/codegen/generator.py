@@ -11,6 +11,51 @@ _CE_ANIM_NAMES: dict[str, str] = {
     "ShowCreation": "Create",
 }
 
+_MANIMGL_IMPORTS = "from manimlib import *\n\n\n"
+_MANIMCE_IMPORTS = "from manim import *\n\n\n"
+
+# Fixed lines of the interactive (preview) scene, built once at import
+_INTERACTIVE_HEADER: tuple[str, ...] = (
+    "        # Lock 16:9 aspect ratio on resize",
+    "        if self.window:",
+    "            self.window.fixed_aspect_ratio = 16 / 9",
+    "",
+    "        # Scene boundary border",
+    "        _border = Rectangle(width=FRAME_WIDTH, height=FRAME_HEIGHT,",
+    "                            stroke_color=WHITE, stroke_width=1)",
+    "        self.add(_border)",
+    "",
+)
+_INTERACTIVE_FOOTER_HEAD: tuple[str, ...] = (
+    "",
+    "        # Keep GL window alive, watch for hot-reload",
+    "        import os as _os, time as _time",
+)
+_INTERACTIVE_FOOTER_TAIL: tuple[str, ...] = (
+    "        _lm = 0.0",
+    "        while not self.is_window_closing():",
+    "            self.update_frame(dt=0)",
+    "            try:",
+    "                _mt = _os.path.getmtime(_rp)",
+    "                if _mt > _lm:",
+    "                    _lm = _mt",
+    "                    exec(open(_rp).read())",
+    "                    self.update_frame(dt=0, force_draw=True)",
+    "            except FileNotFoundError:",
+    "                pass",
+    "            _time.sleep(0.02)",
+)
+
+
+def generate_manimgl_imports() -> str:
+    """Return the import preamble that precedes the first ManimGL scene."""
+    return _MANIMGL_IMPORTS
+
+
+def generate_manimce_imports() -> str:
+    """Return the import preamble that precedes the first Manim CE scene."""
+    return _MANIMCE_IMPORTS
+
 
 def _generate_body(
     scene_state: SceneState,
@@ -103,10 +148,7 @@ def generate_manimgl_code(
     bg_color: str = "#000000",
 ) -> str:
     """Generate a complete ManimGL script from the current scene state."""
-    lines: list[str] = []
-    if include_import:
-        lines += ["from manimlib import *", "", ""]
-    lines += [
+    lines: list[str] = [
         f"class {scene_name}(Scene):",
         "    def construct(self):",
     ]
@@ -116,15 +158,7 @@ def generate_manimgl_code(
         lines.append("")
 
     if interactive:
-        lines.append("        # Lock 16:9 aspect ratio on resize")
-        lines.append("        if self.window:")
-        lines.append("            self.window.fixed_aspect_ratio = 16 / 9")
-        lines.append("")
-        lines.append("        # Scene boundary border")
-        lines.append("        _border = Rectangle(width=FRAME_WIDTH, height=FRAME_HEIGHT,")
-        lines.append("                            stroke_color=WHITE, stroke_width=1)")
-        lines.append("        self.add(_border)")
-        lines.append("")
+        lines.extend(_INTERACTIVE_HEADER)
 
     body = _generate_body(scene_state, indent="        ")
     if not body and not interactive:
@@ -133,24 +167,12 @@ def generate_manimgl_code(
         lines.extend(body)
 
     if interactive:
-        lines.append("")
-        lines.append("        # Keep GL window alive, watch for hot-reload")
-        lines.append("        import os as _os, time as _time")
+        lines.extend(_INTERACTIVE_FOOTER_HEAD)
         lines.append(f'        _rp = r"{replay_file}"')
-        lines.append("        _lm = 0.0")
-        lines.append("        while not self.is_window_closing():")
-        lines.append("            self.update_frame(dt=0)")
-        lines.append("            try:")
-        lines.append("                _mt = _os.path.getmtime(_rp)")
-        lines.append("                if _mt > _lm:")
-        lines.append("                    _lm = _mt")
-        lines.append("                    exec(open(_rp).read())")
-        lines.append("                    self.update_frame(dt=0, force_draw=True)")
-        lines.append("            except FileNotFoundError:")
-        lines.append("                pass")
-        lines.append("            _time.sleep(0.02)")
+        lines.extend(_INTERACTIVE_FOOTER_TAIL)
 
-    return "\n".join(lines) + "\n"
+    code = "\n".join(lines) + "\n"
+    return _MANIMGL_IMPORTS + code if include_import else code
 
 
 def generate_manimce_code(
@@ -160,10 +182,7 @@ def generate_manimce_code(
     bg_color: str = "#000000",
 ) -> str:
     """Generate a complete Manim Community Edition script from the current scene state."""
-    lines: list[str] = []
-    if include_import:
-        lines += ["from manim import *", "", ""]
-    lines += [
+    lines: list[str] = [
         f"class {scene_name}(Scene):",
         "    def construct(self):",
     ]
@@ -178,7 +197,8 @@ def generate_manimce_code(
     else:
         lines.extend(body)
 
-    return "\n".join(lines) + "\n"
+    code = "\n".join(lines) + "\n"
+    return _MANIMCE_IMPORTS + code if include_import else code
 
 
 def generate_replay_code(scene_state: SceneState, bg_color: str = "#000000") -> str:
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 class ParsedObject:
     name: str
     latex: str
-    color: str = "#FFFFFF"
+    color: str = "#ffffff"  # colors are normalized to lowercase hex
     font_size: int = 48
     pos_x: float = 0.0  # manim coords
     pos_y: float = 0.0
@@ -34,6 +34,10 @@ class ParsedScene:
     bg_color: str = "#000000"
     objects: list[ParsedObject] = field(default_factory=list)
     animations: list[ParsedAnimation] = field(default_factory=list)
+    names: frozenset[str] = field(init=False)  # names of `objects`
+
+    def __post_init__(self):
+        self.names = frozenset(obj.name for obj in self.objects)
 
 
 # ---------------------------------------------------------------------------
@@ -90,7 +94,8 @@ def parse_code(code: str) -> list[ParsedScene] | None:
 
 def _parse_scene_block(scene_name: str, block: str) -> ParsedScene:
     """Parse a single scene's construct() body."""
-    scene = ParsedScene(name=scene_name)
+    bg_color = "#000000"
+    animations: list[ParsedAnimation] = []
     objects: dict[str, ParsedObject] = {}
 
     for line in block.splitlines():
@@ -101,11 +106,11 @@ def _parse_scene_block(scene_name: str, block: str) -> ParsedScene:
         # Background color
         m = _RE_BG_CE.search(stripped)
         if m:
-            scene.bg_color = m.group(1)
+            bg_color = m.group(1).lower()
             continue
         m = _RE_BG_GL.search(stripped)
         if m:
-            scene.bg_color = m.group(1)
+            bg_color = m.group(1).lower()
             continue
 
         # Object declaration
@@ -119,7 +124,7 @@ def _parse_scene_block(scene_name: str, block: str) -> ParsedScene:
         # Object color
         m = _RE_COLOR.search(stripped)
         if m:
-            name, color = m.group(1), m.group(2)
+            name, color = m.group(1), m.group(2).lower()
             if name in objects:
                 objects[name].color = color
             continue
@@ -153,7 +158,7 @@ def _parse_scene_block(scene_name: str, block: str) -> ParsedScene:
         m = _RE_ADD.search(stripped)
         if m:
             target = m.group(1)
-            scene.animations.append(ParsedAnimation(
+            animations.append(ParsedAnimation(
                 target_name=target, anim_type="Add",
                 duration=0.0, easing="",
             ))
@@ -163,7 +168,7 @@ def _parse_scene_block(scene_name: str, block: str) -> ParsedScene:
         m = _RE_WAIT.search(stripped)
         if m:
             dur = float(m.group(1)) if m.group(1) else 1.0
-            scene.animations.append(ParsedAnimation(
+            animations.append(ParsedAnimation(
                 target_name="", anim_type="Wait",
                 duration=dur, easing="",
             ))
@@ -178,11 +183,13 @@ def _parse_scene_block(scene_name: str, block: str) -> ParsedScene:
             easing = m.group(4) or "smooth"
             # Normalize CE animation names back to canonical form
             anim_type = _CE_TO_GL_ANIM.get(anim_type, anim_type)
-            scene.animations.append(ParsedAnimation(
+            animations.append(ParsedAnimation(
                 target_name=target, anim_type=anim_type,
                 duration=dur, easing=easing,
             ))
             continue
 
-    scene.objects = list(objects.values())
-    return scene
+    return ParsedScene(
+        name=scene_name, bg_color=bg_color,
+        objects=list(objects.values()), animations=animations,
+    )
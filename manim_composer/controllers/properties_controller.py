@@ -20,6 +20,8 @@ class PropertiesController(QObject):
         self._current_name: str | None = None
         self._current_anim_index: int | None = None
         self._updating = False
+        # Position last shown in the spin boxes; repaints that leave it alone are ignored
+        self._shown_pos = None
 
         self._latex_timer = QTimer(self)
         self._latex_timer.setSingleShot(True)
@@ -87,6 +89,7 @@ class PropertiesController(QObject):
         self.w.spinFontSize.setValue(tracked.font_size)
 
         pos = item.pos()
+        self._shown_pos = pos
         self.w.spinPosX.setValue(pos.x() / 100.0)
         self.w.spinPosY.setValue(-pos.y() / 100.0)
         self._updating = False
@@ -113,6 +116,7 @@ class PropertiesController(QObject):
         tracked.name = new_name
         self.state.register(new_name, tracked, item)
         self._current_name = new_name
+        self.w._touch_scene()
 
     def _on_latex_edited(self):
         if self._updating or not self._current_name:
@@ -128,6 +132,7 @@ class PropertiesController(QObject):
             new_latex = self.w.editLatexCode.toPlainText()
             tracked.latex = new_latex
             item.set_latex(new_latex)
+            self.w._touch_scene()
 
     def _on_color_btn_clicked(self):
         if not self._current_name:
@@ -143,7 +148,8 @@ class PropertiesController(QObject):
             item.set_color(hex_color)
             self.w.btnTextColor.setText(hex_color)
             self.w.btnTextColor.setStyleSheet(f"background-color: {hex_color};")
-            self.w._refresh_code_editors()
+            self.w._touch_scene()
+            self.w._request_code_refresh()
 
     def _on_font_size_changed(self, value: int):
         if self._updating or not self._current_name:
@@ -153,7 +159,8 @@ class PropertiesController(QObject):
         if tracked and item:
             tracked.font_size = value
             item.set_font_size(value)
-            self.w._refresh_code_editors()
+            self.w._touch_scene()
+            self.w._request_code_refresh()
 
     def _on_position_changed(self):
         if self._updating or not self._current_name:
@@ -163,7 +170,8 @@ class PropertiesController(QObject):
             x = self.w.spinPosX.value() * 100.0
             y = -self.w.spinPosY.value() * 100.0
             item.setPos(x, y)
-            self.w._refresh_code_editors()
+            self.w._touch_scene()
+            self.w._request_code_refresh()
 
     # --- Drag sync ---
 
@@ -172,13 +180,14 @@ class PropertiesController(QObject):
             return
         try:
             item = self.state.get_item(self._current_name)
-            if item:
+            if item and item.pos() != self._shown_pos:
                 self._updating = True
-                pos = item.pos()
+                pos = self._shown_pos = item.pos()
                 self.w.spinPosX.setValue(pos.x() / 100.0)
                 self.w.spinPosY.setValue(-pos.y() / 100.0)
                 self._updating = False
-                self.w._refresh_code_editors()
+                self.w._touch_scene()
+                self.w._request_code_refresh()
         except RuntimeError:
             return
 
@@ -245,7 +254,8 @@ class PropertiesController(QObject):
         if 0 <= self._current_anim_index < len(anims):
             anims[self._current_anim_index].target_name = text
             self._refresh_anim_list_item(self._current_anim_index)
-            self.w._refresh_code_editors()
+            self.w._touch_scene()
+            self.w._request_code_refresh()
 
     def _on_anim_type_changed(self, text: str):
         if self._updating or self._current_anim_index is None or not text:
@@ -260,7 +270,8 @@ class PropertiesController(QObject):
             self.w.spinAnimDuration.setEnabled(not is_add)
             self.w.comboAnimTarget.setEnabled(not is_wait)
             self._refresh_anim_list_item(self._current_anim_index)
-            self.w._refresh_code_editors()
+            self.w._touch_scene()
+            self.w._request_code_refresh()
 
     def _on_anim_duration_changed(self, value: float):
         if self._updating or self._current_anim_index is None:
@@ -269,7 +280,8 @@ class PropertiesController(QObject):
         if 0 <= self._current_anim_index < len(anims):
             anims[self._current_anim_index].duration = value
             self._refresh_anim_list_item(self._current_anim_index)
-            self.w._refresh_code_editors()
+            self.w._touch_scene()
+            self.w._request_code_refresh()
 
     def _on_anim_easing_changed(self, text: str):
         if self._updating or self._current_anim_index is None or not text:
@@ -277,7 +289,8 @@ class PropertiesController(QObject):
         anims = self.state.all_animations()
         if 0 <= self._current_anim_index < len(anims):
             anims[self._current_anim_index].easing = text
-            self.w._refresh_code_editors()
+            self.w._touch_scene()
+            self.w._request_code_refresh()
 
     def _refresh_anim_list_item(self, row: int):
         """Update a single animation list row's display text."""
@@ -286,10 +299,4 @@ class PropertiesController(QObject):
             anim = anims[row]
             list_item = self.w.animationsList.item(row)
             if list_item:
-                if anim.anim_type == "Add":
-                    text = f"{row + 1}. Add({anim.target_name})"
-                elif anim.anim_type == "Wait":
-                    text = f"{row + 1}. Wait — {anim.duration:.1f}s"
-                else:
-                    text = f"{row + 1}. {anim.anim_type}({anim.target_name}) — {anim.duration:.1f}s"
-                list_item.setText(text)
+                list_item.setText(self.w._format_anim_label(row, anim))
@@ -1,33 +1,64 @@
 """Manim Composer — Entry point."""
 
+import codecs
+import glob
 import sys
 import os
 import tempfile
+import threading
+from dataclasses import dataclass
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QButtonGroup, QGraphicsScene,
     QAbstractItemView, QGraphicsView, QListView, QPlainTextEdit,
+    QGraphicsSimpleTextItem, QFileDialog, QListWidgetItem, QColorDialog,
+)
+from PyQt6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QTextCursor, QCursor
+from PyQt6.QtCore import (
+    Qt, QEvent, QIODevice, QProcess, QPointF, QProcessEnvironment,
+    QSocketNotifier, QThreadPool, QTimer,
 )
-from PyQt6.QtGui import QBrush, QColor, QPainter, QPen, QTextCursor, QCursor
-from PyQt6.QtCore import Qt, QEvent, QProcess, QPointF, QProcessEnvironment, QTimer
 from PyQt6 import uic
 
-from manim_composer.views.canvas_items.mathtex_item import MathTexItem
+try:
+    from PyQt6.QtGui import QOpenGLContext, QSurfaceFormat
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL: the canvas keeps its raster viewport
+    QOpenGLWidget = None
+
+from manim_composer.views.canvas_items.mathtex_item import (
+    MathTexItem, TexRenderTask, clear_render_caches, dpi_for_font_size, pixmap_from_png,
+    prewarm_rendering, render_fallback,
+)
+from manim_composer.views.canvas_items.scene_layer_item import SceneLayerItem
 from manim_composer.models.scene_state import SceneState, TrackedObject, AnimationEntry
 from manim_composer.controllers.properties_controller import PropertiesController
-from manim_composer.codegen.generator import generate_manimce_code, generate_manimgl_code, generate_replay_code
+from manim_composer.codegen.generator import (
+    generate_manimce_code, generate_manimce_imports, generate_manimgl_code,
+    generate_manimgl_imports, generate_replay_code,
+)
 from manim_composer.codegen.parser import parse_code
 from manim_composer import latex_manager
 from manim_composer.syntax_highlighter import PythonHighlighter
 
-# Launcher script template for manimgl preview.
+# Widget tree precompiled from main_window.ui; regenerate after editing the
+# layout with:  pyuic6 main_window.ui -o ui_main_window.py
+try:
+    from manim_composer.ui_main_window import Ui_MainWindow
+except ImportError:  # not generated: parse the .ui file at startup instead
+    Ui_MainWindow = None
+
+# Launcher script for manimgl preview, written once per session and invoked as
+#   launcher.py <scene_file> <scene_name> <win_x> <win_y>
 # Patches the -no-pdf issue on MiKTeX before running manimgl.
-_LAUNCHER_TEMPLATE = r'''
-import sys, re, subprocess, tempfile
+_LAUNCHER_SCRIPT = r'''
+import sys, subprocess, tempfile, hashlib
 from pathlib import Path
 
+_scene_file, _scene_name, _win_x, _win_y = sys.argv[1:5]
+
 # Set argv BEFORE importing manimlib — config is parsed at import time
-sys.argv = ["manimlib", "{scene_file}", "{scene_name}", "-c", "#000000"]
+sys.argv = ["manimlib", _scene_file, _scene_name, "-c", "#000000"]
 
 # Now import manimlib (triggers config initialization with correct argv)
 import manimlib.utils.tex_file_writing as _tex_mod
@@ -36,31 +67,51 @@ from manimlib.utils.cache import cache_on_disk as _cache_on_disk
 # Patch manimgl: MiKTeX's latex rejects -no-pdf (only needed for xelatex)
 _orig_LatexError = _tex_mod.LatexError
 
+# Per-formula working dirs that survive across previews (keyed by compiler + source)
+_LATEX_CACHE = Path(tempfile.gettempdir()) / "manim_composer_latex_cache"
+
 @_cache_on_disk
 def _patched_full_tex_to_svg(full_tex, compiler="latex", message=""):
+    key = hashlib.sha1((compiler + "\x00" + full_tex).encode()).hexdigest()
+    td = _LATEX_CACHE / key
+    svg_path = td / "out.svg"
+    if svg_path.exists():
+        return svg_path.read_text(encoding="utf-8")
     if message:
         print(message, end="\r")
     dvi_ext = ".dvi" if compiler == "latex" else ".xdv"
-    with tempfile.TemporaryDirectory() as td:
-        tex_path = Path(td, "working.tex")
-        tex_path.write_text(full_tex)
-        cmd = [compiler, "-interaction=batchmode", "-halt-on-error",
-               f"-output-directory={{td}}", str(tex_path)]
-        if compiler == "xelatex":
-            cmd.insert(1, "-no-pdf")
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode != 0:
-            err = ""
-            log_p = tex_path.with_suffix(".log")
-            if log_p.exists():
-                m = re.search(r"(?<=\n! ).*\n.*\n", log_p.read_text())
-                if m:
-                    err = m.group()
-            raise _orig_LatexError(err or "LaTeX compilation failed")
-        proc2 = subprocess.run(
+    td.mkdir(parents=True, exist_ok=True)
+    tex_path = td / "working.tex"
+    tex_path.write_text(full_tex)
+    cmd = [compiler, "-interaction=batchmode", "-halt-on-error",
+           f"-output-directory={td}", str(tex_path)]
+    if compiler == "xelatex":
+        cmd.insert(1, "-no-pdf")
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        err = ""
+        log_p = tex_path.with_suffix(".log")
+        if log_p.exists():
+            # -halt-on-error stops at the first error, so it sits near the end of the log
+            with log_p.open("rb") as f:
+                f.seek(max(0, f.seek(0, 2) - 8192))
+                tail = f.read().decode("utf-8", "replace")
+            start = tail.find("\n! ")
+            if start >= 0:
+                lines = tail[start + 3:].split("\n", 2)
+                if len(lines) == 3:
+                    err = lines[0] + "\n" + lines[1] + "\n"
+        raise _orig_LatexError(err or "LaTeX compilation failed")
+    # Read the SVG straight off the pipe (one buffer, no communicate() chunk list)
+    with subprocess.Popen(
             ["dvisvgm", str(tex_path.with_suffix(dvi_ext)), "-n", "-v", "0", "--stdout"],
-            capture_output=True)
-        result = proc2.stdout.decode("utf-8")
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc2:
+        result = proc2.stdout.read().decode("utf-8")
+    if result:
+        # Write-then-rename so a concurrent reader never sees a partial file
+        tmp_svg = td / "out.svg.tmp"
+        tmp_svg.write_text(result, encoding="utf-8")
+        tmp_svg.replace(svg_path)
     if message:
         print(" " * len(message), end="\r")
     return result
@@ -69,12 +120,27 @@ _tex_mod.full_tex_to_svg = _patched_full_tex_to_svg
 
 # Position the preview window adjacent to the Composer
 from manimlib.config import manim_config
-manim_config.window_config.position = ({win_x}, {win_y})
+manim_config.window_config.position = (int(_win_x), int(_win_y))
 
 from manimlib.__main__ import main
 main()
 '''
 
+# Most preview-log bytes pulled into the Console pane at once; older output is skipped.
+_PREVIEW_LOG_TAIL_MAX = 256 * 1024
+# Size at which the preview log is emptied once its bytes have been pulled
+_PREVIEW_LOG_MAX = 1024 * 1024
+
+# Console pane limits: oldest lines are dropped, very long lines hard-wrapped
+_CONSOLE_MAX_BLOCKS = 5000
+_CONSOLE_LINE_MAX = 4096
+
+# Above this size (UTF-8 bytes) the code editors drop syntax highlighting
+_LARGE_DOC_BYTES = 500_000
+
+# Per-scene generated-code cache size (entries per GL/CE cache)
+_CODE_CACHE_MAX = 256
+
 # Quality presets for Manim CE rendering: label → (width, height, fps)
 _QUALITY_PRESETS = {
     "480p 15fps": (854, 480, 15),
@@ -84,36 +150,149 @@ _QUALITY_PRESETS = {
 }
 
 
-class ManimComposerWindow(QMainWindow):
-    """Main application window, loaded from the .ui file."""
+@dataclass(slots=True, frozen=True)
+class _Clip:
+    """One copied canvas object (MathTex only for now)."""
+    latex: str
+    color: str
+    font_size: int
+    pos_x: float
+    pos_y: float
+
+
+def _anim_key(anim) -> tuple:
+    """Comparable (target, type, duration, easing) tuple for a parsed or stored animation."""
+    return (anim.target_name, anim.anim_type, anim.duration, anim.easing)
+
+
+def _write_text(path: str, text: str, prefix: bytes = b"") -> None:
+    """Write *prefix* + *text* (as UTF-8) with a single unbuffered write.
+
+    Where os.writev exists the prefix goes out in the same syscall without
+    being concatenated with the text first.
+    """
+    data = text.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        if prefix and hasattr(os, "writev"):
+            written = os.writev(fd, [prefix, data])
+            if written >= len(prefix):
+                data = memoryview(data)[written - len(prefix):]
+            else:
+                data = memoryview(prefix[written:] + data)
+        else:
+            data = memoryview(prefix + data if prefix else data)
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(path: str, text: str) -> None:
+    """Write *text* via a temp file and rename, so readers never see it half-written."""
+    tmp = path + ".tmp"
+    _write_text(tmp, text)
+    try:
+        os.replace(tmp, path)
+    except PermissionError:
+        # Windows refuses the rename while the reader has the file open
+        _write_text(path, text)
+
+
+def _utf16_len(text: str) -> int:
+    """Length of *text* in UTF-16 code units (QTextDocument positions)."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _wrap_long_lines(text: str, width: int = _CONSOLE_LINE_MAX):
+    """Yield *text* line by line, hard-wrapping lines longer than *width*."""
+    for line in text.splitlines(keepends=True):
+        body = line.rstrip("\r\n")
+        end = line[len(body):]
+        while len(body) > width:
+            yield body[:width] + "\n"
+            body = body[width:]
+        yield body + end
+
+
+class _LatestFileWriter:
+    """Write text to one file on a worker thread, keeping only the newest.
+
+    Text submitted while a write is queued or running replaces any pending
+    text, so a burst of edits costs at most one extra write.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Own single-thread pool: the global one also runs slow LaTeX compiles
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+        self._lock = threading.Lock()
+        # Held for each take-and-write, so cancel() can wait out a write in flight
+        self._write_lock = threading.Lock()
+        self._pending: str | None = None
+        self._running = False
+
+    def submit(self, text: str) -> None:
+        with self._lock:
+            self._pending = text
+            if self._running:
+                return
+            self._running = True
+        self._pool.start(self._drain)
+
+    def cancel(self) -> None:
+        """Drop any pending text and wait for a write in progress to finish."""
+        with self._write_lock, self._lock:
+            self._pending = None
+
+    def _drain(self) -> None:
+        while True:
+            with self._write_lock:
+                with self._lock:
+                    text, self._pending = self._pending, None
+                    if text is None:
+                        self._running = False
+                        return
+                _atomic_write(self.path, text)
+
+
+class ManimComposerWindow(QMainWindow, Ui_MainWindow or object):
+    """Main application window, built from the .ui layout."""
 
     def __init__(self):
         super().__init__()
 
-        # Load the .ui file
-        ui_path = os.path.join(os.path.dirname(__file__), "main_window.ui")
-        uic.loadUi(ui_path, self)
+        if Ui_MainWindow is not None:
+            self.setupUi(self)
+        else:
+            ui_path = os.path.join(os.path.dirname(__file__), "main_window.ui")
+            uic.loadUi(ui_path, self)
 
         self._fix_widget_enums()
         self._setup_toolbar_tabs()
         self._setup_center_tabs()
         self._setup_tool_button_group()
-        default_item = self._setup_canvas()
+        self._setup_canvas()
         self._setup_default_proportions()
         self._setup_window_geometry()
 
         # MVP wiring
-        self._scenes: list[dict] = []  # Each: {"name": str, "state": SceneState}
-        self._current_scene_idx: int = 0
+        # Each: {"id": int, "rev": int, "name": str, "state": SceneState,
+        #        "bg_color": str, "layer": SceneLayerItem}
+        self._scenes: list[dict] = []
         self._scene_counter: int = 1
+        self._next_scene_id: int = 0
         self._updating_scenes: bool = False
         self._add_scene_entry("Scene1")
-        self._clipboard: dict | None = None
-        self._register_default_item(default_item)
+        self._current_scene_idx = 0
+        self._clipboard: list[_Clip] = []
+        self._export_dialog: QFileDialog | None = None
+        self._last_export_dir: str = ""
         self.props_controller = PropertiesController(self, self.scene_state)
+        self._setup_code_generation()
         self._setup_scenes_panel()
         self._setup_animations_panel()
-        self._setup_code_generation()
         self._setup_delete_action()
         self._setup_copy_paste()
         self._setup_preview()
@@ -123,23 +302,56 @@ class ManimComposerWindow(QMainWindow):
 
     # --- Scene management ---
 
+    @property
+    def _current_scene_idx(self) -> int:
+        return self._current_idx
+
+    @_current_scene_idx.setter
+    def _current_scene_idx(self, idx: int) -> None:
+        # Keep a direct reference to the current scene dict alongside its index
+        self._current_idx = idx
+        self._current_scene: dict = self._scenes[idx]
+
     @property
     def scene_state(self) -> SceneState:
-        return self._scenes[self._current_scene_idx]["state"]
+        return self._current_scene["state"]
 
     def _current_scene_name(self) -> str:
-        return self._scenes[self._current_scene_idx]["name"]
+        return self._current_scene["name"]
 
     def _add_scene_entry(self, name: str, bg_color: str = "#000000") -> None:
         """Create a new scene and add it to the scenes list."""
-        self._scenes.append({"name": name, "state": SceneState(), "bg_color": bg_color})
+        # All of the scene's canvas items are parented to its layer
+        layer = SceneLayerItem()
+        self.canvas_scene.addItem(layer)
+        self._scenes.append({
+            "id": self._next_scene_id, "rev": 0,
+            "name": name, "state": SceneState(), "bg_color": bg_color,
+            "layer": layer,
+        })
+        self._next_scene_id += 1
         self._updating_scenes = True
-        from PyQt6.QtWidgets import QListWidgetItem
         item = QListWidgetItem(name)
         item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
         self.scenesList.addItem(item)
         self._updating_scenes = False
 
+    def _add_canvas_item(self, item, idx: int | None = None) -> None:
+        """Put *item* on the canvas as part of a scene (default: current)."""
+        if idx is None:
+            idx = self._current_scene_idx
+        item.setParentItem(self._scenes[idx]["layer"])
+
+    def _touch_scene(self, idx: int | None = None) -> None:
+        """Mark a scene (default: current) as modified so its cached code is regenerated."""
+        if idx is None:
+            idx = self._current_scene_idx
+        if 0 <= idx < len(self._scenes):
+            scene = self._scenes[idx]
+            scene["rev"] += 1
+            self._dirty_gl.add(scene["id"])
+            self._dirty_ce.add(scene["id"])
+
     def _setup_scenes_panel(self):
         """Wire scenes list buttons, selection, rename, and drag-drop."""
         self.btnAddScene.clicked.connect(self._on_add_scene)
@@ -165,7 +377,7 @@ class ManimComposerWindow(QMainWindow):
 
         self._scene_counter += 1
         name = f"Scene{self._scene_counter}"
-        old_bg = self._scenes[self._current_scene_idx].get("bg_color", "#000000")
+        old_bg = self._current_scene.get("bg_color", "#000000")
         # Hide current scene items
         self._hide_scene_items(self._current_scene_idx)
         self._add_scene_entry(name, bg_color=old_bg)
@@ -181,11 +393,15 @@ class ManimComposerWindow(QMainWindow):
             if not old_item:
                 continue
             pos = old_item.pos()
+            # Same formula and color: share the source's rendered pixmap
+            # (unless it is still a placeholder waiting on its render)
             new_item = MathTexItem(
                 latex=tracked.latex, color=tracked.color,
                 font_size=tracked.font_size,
+                base_pixmap=None if old_item.render_pending else old_item._base_pixmap,
+                base_dpi=old_item._base_dpi,
             )
-            self.canvas_scene.addItem(new_item)
+            self._add_canvas_item(new_item, new_idx)
             new_item.setPos(pos)
             new_tracked = TrackedObject(
                 name=tracked.name, obj_type=tracked.obj_type,
@@ -198,6 +414,7 @@ class ManimComposerWindow(QMainWindow):
                 duration=0.0, easing="",
             ))
 
+        self._touch_scene(new_idx)
         self.scenesList.setCurrentRow(new_idx)
 
     def _on_delete_scene(self):
@@ -208,17 +425,17 @@ class ManimComposerWindow(QMainWindow):
         idx = self.scenesList.currentRow()
         if idx < 0:
             return
-        # Remove canvas items for this scene
-        state = self._scenes[idx]["state"]
-        for name, _ in state.all_objects():
-            obj_item = state.get_item(name)
-            if obj_item:
-                self.canvas_scene.removeItem(obj_item)
+        # Removing the layer takes all of the scene's canvas items with it
+        self.canvas_scene.removeItem(self._scenes[idx]["layer"])
         self._scenes.pop(idx)
         self.scenesList.takeItem(idx)
         # Select adjacent scene
         new_idx = min(idx, len(self._scenes) - 1)
-        self.scenesList.setCurrentRow(new_idx)
+        if self.scenesList.currentRow() == new_idx:
+            # Same row number, so currentRowChanged won't fire; switch explicitly
+            self._on_scene_selected(new_idx)
+        else:
+            self.scenesList.setCurrentRow(new_idx)
 
     def _on_scene_selected(self, row: int):
         """Switch to the selected scene."""
@@ -231,10 +448,10 @@ class ManimComposerWindow(QMainWindow):
         # Show new scene items
         self._show_scene_items(row)
         self._refresh_animations_list()
-        self._refresh_code_editors()
+        self._request_code_refresh()
         # Apply this scene's background color
         bg = self._scenes[row].get("bg_color", "#000000")
-        self.canvas_scene.setBackgroundBrush(QBrush(QColor(bg)))
+        self._set_canvas_bg(bg)
         # Show scene properties
         self._show_scene_properties(row)
         self.canvas_scene.clearSelection()
@@ -248,20 +465,12 @@ class ManimComposerWindow(QMainWindow):
     def _hide_scene_items(self, idx: int):
         """Hide all canvas items for the given scene index."""
         if 0 <= idx < len(self._scenes):
-            state = self._scenes[idx]["state"]
-            for name, _ in state.all_objects():
-                item = state.get_item(name)
-                if item:
-                    item.setVisible(False)
+            self._scenes[idx]["layer"].setVisible(False)
 
     def _show_scene_items(self, idx: int):
         """Show all canvas items for the given scene index."""
         if 0 <= idx < len(self._scenes):
-            state = self._scenes[idx]["state"]
-            for name, _ in state.all_objects():
-                item = state.get_item(name)
-                if item:
-                    item.setVisible(True)
+            self._scenes[idx]["layer"].setVisible(True)
 
     def _on_scene_renamed(self, item):
         """Update scene name when the user edits it in the list."""
@@ -270,7 +479,8 @@ class ManimComposerWindow(QMainWindow):
         row = self.scenesList.row(item)
         if 0 <= row < len(self._scenes):
             self._scenes[row]["name"] = item.text()
-            self._refresh_code_editors()
+            self._touch_scene(row)
+            self._request_code_refresh()
 
     def _on_scene_rows_moved(self, _src, start, _end, _dst, dest_row):
         """Sync drag-drop reorder of scenes."""
@@ -285,7 +495,7 @@ class ManimComposerWindow(QMainWindow):
             self._current_scene_idx -= 1
         elif new_idx <= self._current_scene_idx < old_idx:
             self._current_scene_idx += 1
-        self._refresh_code_editors()
+        self._request_code_refresh()
 
     # --- Scene properties ---
 
@@ -298,10 +508,30 @@ class ManimComposerWindow(QMainWindow):
         self.propertiesStack.setCurrentIndex(4)  # propsScenePage
         self.editSceneName.setText(scene["name"])
         bg = scene.get("bg_color", "#000000")
-        self.btnSceneBgColor.setText(bg)
-        self.btnSceneBgColor.setStyleSheet(f"background-color: {bg};")
+        self._set_bg_button(bg)
         self._updating_scenes = False
 
+    def _set_bg_button(self, bg: str):
+        """Show *bg* on the background-color button (restyled only on change)."""
+        if bg == self._bg_button_color:
+            return
+        self._bg_button_color = bg
+        self.btnSceneBgColor.setText(bg)
+        style = self._bg_style_cache.get(bg)
+        if style is None:
+            style = self._bg_style_cache[bg] = f"background-color: {bg};"
+        self.btnSceneBgColor.setStyleSheet(style)
+
+    def _set_canvas_bg(self, bg: str):
+        """Paint the canvas background with *bg*, reusing brushes per color."""
+        if bg == self._canvas_bg:
+            return
+        self._canvas_bg = bg
+        brush = self._bg_brush_cache.get(bg)
+        if brush is None:
+            brush = self._bg_brush_cache[bg] = QBrush(QColor(bg))
+        self.canvas_scene.setBackgroundBrush(brush)
+
     def _on_scene_name_edited(self):
         """Update scene name from the properties panel."""
         if self._updating_scenes:
@@ -314,20 +544,20 @@ class ManimComposerWindow(QMainWindow):
         self._updating_scenes = True
         self.scenesList.item(idx).setText(new_name)
         self._updating_scenes = False
-        self._refresh_code_editors()
+        self._touch_scene()
+        self._request_code_refresh()
 
     def _on_scene_bg_color_clicked(self):
         """Pick a background color for the current scene."""
-        from PyQt6.QtWidgets import QColorDialog
         idx = self._current_scene_idx
         current = self._scenes[idx].get("bg_color", "#000000")
         color = QColorDialog.getColor(QColor(current), self, "Scene Background Color")
         if color.isValid():
             hex_color = color.name()
             self._scenes[idx]["bg_color"] = hex_color
-            self.btnSceneBgColor.setText(hex_color)
-            self.btnSceneBgColor.setStyleSheet(f"background-color: {hex_color};")
-            self.canvas_scene.setBackgroundBrush(QBrush(QColor(hex_color)))
+            self._touch_scene(idx)
+            self._set_bg_button(hex_color)
+            self._set_canvas_bg(hex_color)
             if self._preview_alive():
                 self._replay_preview()
 
@@ -341,7 +571,6 @@ class ManimComposerWindow(QMainWindow):
 
     def _on_browse_output(self):
         """Browse for a custom output directory."""
-        from PyQt6.QtWidgets import QFileDialog
         path = QFileDialog.getExistingDirectory(self, "Select Output Directory")
         if path:
             self.editOutputDir.setText(path)
@@ -404,11 +633,29 @@ class ManimComposerWindow(QMainWindow):
         self.move(screen.x(), screen.y())
 
     def _setup_canvas(self):
-        """Initialize the QGraphicsScene with black background and a default MathTex."""
+        """Initialize the QGraphicsScene with black background and a default MathTex.
+
+        The default MathTex is created after the first paint; see
+        _deferred_create_default_item.
+        """
         self.canvas_scene = QGraphicsScene(self)
         self.canvas_scene.setSceneRect(-700, -400, 1400, 800)
-        self.canvas_scene.setBackgroundBrush(QBrush(QColor("#000000")))
+        # Canvas background brushes and color-button stylesheets, per hex color
+        self._bg_brush_cache: dict[str, QBrush] = {}
+        self._bg_style_cache: dict[str, str] = {}
+        self._canvas_bg: str | None = None
+        self._bg_button_color: str | None = None
+        self._set_canvas_bg("#000000")
+        # Spatial index for hit tests/selection; depth 0 lets Qt size the tree
+        self.canvas_scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        self.canvas_scene.setBspTreeDepth(0)
         self.canvasView.setScene(self.canvas_scene)
+        # Repaint only what changed and keep the flat background cached.
+        # (Antialiasing stays on, so the view still pads exposed rects for it.)
+        self.canvasView.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.canvasView.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState)
+        self.canvasView.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self._setup_gl_viewport()
 
         # White border showing the renderable scene boundary
         border_pen = QPen(QColor("#FFFFFF"))
@@ -416,26 +663,92 @@ class ManimComposerWindow(QMainWindow):
         border_pen.setCosmetic(True)  # always 2px regardless of zoom
         self.canvas_scene.addRect(-700, -400, 1400, 800, border_pen)
 
-        # Place default F=ma at the center
-        self.statusBar.showMessage("Rendering LaTeX…")
-        QApplication.processEvents()
-        default_item = MathTexItem(latex="F=ma", color="#FFFFFF")
-        self.canvas_scene.addItem(default_item)
-        default_item.setPos(0, 0)
+        # Listen for tool-click placement (and drag ends) on the canvas
+        self._press_positions: dict[str, QPointF] | None = None
+        self.canvasView.viewport().installEventFilter(self)
+        # Listen for resize to maintain 16:9 aspect ratio via fitInView
+        self.canvasView.installEventFilter(self)
 
-        if MathTexItem._latex_available:
-            self.statusBar.showMessage("LaTeX rendered successfully", 3000)
-        else:
+        # Let the window paint its empty canvas before anything LaTeX-related
+        QTimer.singleShot(0, self._deferred_create_default_item)
+
+    def _setup_gl_viewport(self):
+        """Paint the canvas through OpenGL when a GL context is available.
+
+        Must run before event filters are installed on the viewport, since
+        it replaces the viewport widget.
+        """
+        if QOpenGLWidget is None:
+            return
+        probe = QOpenGLContext()
+        if not probe.create():
+            return
+        gl = QOpenGLWidget()
+        fmt = QSurfaceFormat()
+        fmt.setSamples(4)  # multisampled edges for formulas and the border
+        gl.setFormat(fmt)
+        self.canvasView.setViewport(gl)
+        # A GL viewport redraws the whole frame anyway
+        self.canvasView.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
+    def _deferred_create_default_item(self):
+        """Show an F=ma placeholder and start rendering the default MathTex."""
+        QThreadPool.globalInstance().start(prewarm_rendering)
+        # Plain-text stand-in; the LaTeX compile runs on a worker thread
+        placeholder = QGraphicsSimpleTextItem("F=ma")
+        placeholder.setBrush(QBrush(QColor("#FFFFFF")))
+        placeholder.setFont(QFont("Cambria Math", 28))
+        rect = placeholder.boundingRect()
+        placeholder.setPos(-rect.width() / 2, -rect.height() / 2)
+        # The item belongs to this scene even if the user switches away mid-render
+        self._default_scene = self._current_scene
+        placeholder.setParentItem(self._default_scene["layer"])
+        self._default_placeholder = placeholder
+
+        if not MathTexItem.refresh_availability():
+            self._on_default_tex_ready(None)
+            return
+        self.statusBar.showMessage("Rendering LaTeX…")
+        task = TexRenderTask("F=ma", "#FFFFFF", dpi_for_font_size(48))
+        task.signals.ready.connect(self._on_default_tex_ready)
+        self._default_tex_task = task  # keep the signal holder alive
+        QThreadPool.globalInstance().start(task)
+
+    def _on_default_tex_ready(self, png):
+        """Swap the F=ma placeholder for the rendered MathTex item."""
+        self._default_tex_task = None
+        # Availability comes from the PATH probe; one failed compile doesn't disable LaTeX
+        pixmap = pixmap_from_png(png)
+        failed = pixmap is None
+        if failed:
+            pixmap = render_fallback("F=ma", "#FFFFFF")
+        placeholder, self._default_placeholder = self._default_placeholder, None
+        if placeholder.scene() is not None:
+            self.canvas_scene.removeItem(placeholder)
+        scene, self._default_scene = self._default_scene, None
+        idx = next((i for i, s in enumerate(self._scenes) if s is scene), None)
+        if idx is not None:  # unless the scene was deleted while LaTeX compiled
+            default_item = MathTexItem(
+                latex="F=ma", color="#FFFFFF", base_pixmap=pixmap,
+                base_dpi=None if failed else dpi_for_font_size(48),
+            )
+            self._add_canvas_item(default_item, idx)
+            default_item.setPos(0, 0)
+            self._register_default_item(default_item, scene["state"])
+            if idx == self._current_scene_idx:
+                self._refresh_animations_list()
+            self._touch_scene(idx)
+            self._request_code_refresh()
+
+        if not MathTexItem._latex_available:
             self.statusBar.showMessage(
                 "LaTeX not found — using text fallback (install MiKTeX/TeX Live for full rendering)",
                 5000,
             )
-
-        # Listen for tool-click placement on the canvas
-        self.canvasView.viewport().installEventFilter(self)
-        # Listen for resize to maintain 16:9 aspect ratio via fitInView
-        self.canvasView.installEventFilter(self)
-        return default_item
+        elif failed:
+            self.statusBar.showMessage("LaTeX render failed — using text fallback", 5000)
+        else:
+            self.statusBar.showMessage("LaTeX rendered successfully", 3000)
 
     def closeEvent(self, event):
         """Kill subprocesses when the main window closes."""
@@ -469,7 +782,7 @@ class ManimComposerWindow(QMainWindow):
                     pos = self.canvasView.mapToScene(event.pos())
                     name = self.scene_state.next_name("eq")
                     item = MathTexItem(latex="F=ma", color="#FFFFFF")
-                    self.canvas_scene.addItem(item)
+                    self._add_canvas_item(item)
                     item.setPos(pos.x(), pos.y())
                     tracked = TrackedObject(
                         name=name, obj_type="mathtex",
@@ -483,26 +796,45 @@ class ManimComposerWindow(QMainWindow):
                     )
                     self.scene_state.add_animation(entry)
                     self._refresh_animations_list()
-                    self._refresh_code_editors()
+                    self._touch_scene()
+                    self._request_code_refresh()
                     self.toolSelect.setChecked(True)
                     return True
+                # Snapshot positions so the release can tell whether a drag moved anything
+                self._press_positions = {
+                    name: item.pos() for name, item in self.scene_state.items.items()
+                }
+            elif (
+                event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._press_positions is not None
+            ):
+                before, self._press_positions = self._press_positions, None
+                items = self.scene_state.items
+                # Drags (incl. multi-selection) bypass property edits
+                if any(
+                    (item := items.get(name)) is not None and item.pos() != pos
+                    for name, pos in before.items()
+                ):
+                    self._touch_scene()
+                    self._request_code_refresh()
         return super().eventFilter(obj, event)
 
     # --- MVP: registration, animations, codegen, delete ---
 
-    def _register_default_item(self, item):
-        """Register the default F=ma item created in _setup_canvas."""
-        name = self.scene_state.next_name("eq")
+    def _register_default_item(self, item, state: SceneState):
+        """Register the default F=ma item in *state* once its LaTeX has rendered."""
+        name = state.next_name("eq")
         tracked = TrackedObject(
             name=name, obj_type="mathtex", latex="F=ma", color="#FFFFFF"
         )
-        self.scene_state.register(name, tracked, item)
+        state.register(name, tracked, item)
         # Auto-add Write animation for the default object
         entry = AnimationEntry(
             target_name=name, anim_type="Write",
             duration=1.0, easing="smooth",
         )
-        self.scene_state.add_animation(entry)
+        state.add_animation(entry)
 
     def _setup_animations_panel(self):
         """Wire the animation list buttons and drag-drop reorder sync."""
@@ -530,8 +862,10 @@ class ManimComposerWindow(QMainWindow):
             easing="smooth",
         )
         self.scene_state.add_animation(entry)
-        self._refresh_animations_list()
-        self._refresh_code_editors()
+        count = self.animationsList.count()
+        self.animationsList.addItem(self._format_anim_label(count, entry))
+        self._touch_scene()
+        self._request_code_refresh()
 
     def _on_animation_clicked(self, item):
         """Show animation properties when clicking an already-selected animation."""
@@ -545,15 +879,18 @@ class ManimComposerWindow(QMainWindow):
         row = self.animationsList.currentRow()
         if row >= 0:
             self.scene_state.remove_animation(row)
-            self._refresh_animations_list()
-            self._refresh_code_editors()
+            self.animationsList.takeItem(row)
+            self._renumber_animations(row, self.animationsList.count())
+            self._touch_scene()
+            self._request_code_refresh()
 
     def _move_animation(self, delta: int):
         row = self.animationsList.currentRow()
         if row >= 0:
             self.scene_state.move_animation(row, delta)
-            self._refresh_animations_list()
-            self._refresh_code_editors()
+            self._renumber_animations(min(row, row + delta), max(row, row + delta) + 1)
+            self._touch_scene()
+            self._request_code_refresh()
             new_row = row + delta
             if 0 <= new_row < self.animationsList.count():
                 self.animationsList.setCurrentRow(new_row)
@@ -567,37 +904,80 @@ class ManimComposerWindow(QMainWindow):
         old_idx = start
         new_idx = dest_row if dest_row < start else dest_row - 1
         self.scene_state.move_animation_to(old_idx, new_idx)
-        # Renumber all list labels to match the new order
-        for i, anim in enumerate(self.scene_state.all_animations()):
-            item = self.animationsList.item(i)
-            if item:
-                item.setText(f"{i + 1}. {anim.anim_type}({anim.target_name}) — {anim.duration:.1f}s")
+        # Only rows between the old and new position change their number
+        self._renumber_animations(min(old_idx, new_idx), max(old_idx, new_idx) + 1)
         # Keep the controller's selection index in sync
         ctrl = self.props_controller
         if ctrl._current_anim_index == old_idx:
             ctrl._current_anim_index = new_idx
-        self._refresh_code_editors()
-
-    def _refresh_animations_list(self):
-        """Rebuild the animationsList widget from scene state."""
-        self.animationsList.clear()
-        for i, anim in enumerate(self.scene_state.all_animations()):
-            if anim.anim_type == "Add":
-                label = f"{i + 1}. Add({anim.target_name})"
-            elif anim.anim_type == "Wait":
-                label = f"{i + 1}. Wait — {anim.duration:.1f}s"
-            else:
-                label = f"{i + 1}. {anim.anim_type}({anim.target_name}) — {anim.duration:.1f}s"
-            self.animationsList.addItem(label)
+        self._touch_scene()
+        self._request_code_refresh()
+
+    @staticmethod
+    def _format_anim_label(i: int, anim: AnimationEntry) -> str:
+        """List label for the animation at index *i*."""
+        if anim.anim_type == "Add":
+            return f"{i + 1}. Add({anim.target_name})"
+        if anim.anim_type == "Wait":
+            return f"{i + 1}. Wait — {anim.duration:.1f}s"
+        return f"{i + 1}. {anim.anim_type}({anim.target_name}) — {anim.duration:.1f}s"
+
+    def _refresh_animations_list(self, start: int = 0):
+        """Rebuild the animationsList widget from scene state (rows *start* onward)."""
+        lst = self.animationsList
+        if start <= 0:
+            lst.clear()
+        else:
+            while lst.count() > start:
+                lst.takeItem(lst.count() - 1)
+        anims = self.scene_state.all_animations()
+        for i in range(lst.count(), len(anims)):
+            lst.addItem(self._format_anim_label(i, anims[i]))
+
+    def _renumber_animations(self, lo: int, hi: int):
+        """Rewrite the labels of rows lo..hi-1 from scene state."""
+        anims = self.scene_state.all_animations()
+        hi = min(hi, len(anims), self.animationsList.count())
+        if lo >= hi:
+            return
+        lst = self.animationsList
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            for i in range(max(lo, 0), hi):
+                lst.item(i).setText(self._format_anim_label(i, anims[i]))
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
+            # Repaints requested while disabled were dropped; do one now
+            lst.viewport().update()
 
     def _setup_code_generation(self):
         """Regenerate code when switching to a Code tab."""
+        # (scene id, rev, name, bg_color) -> generated code, without imports
+        self._code_cache_gl: dict[tuple, str] = {}
+        self._code_cache_ce: dict[tuple, str] = {}
+        # Per-scene parts last written to each editor (None = never filled);
+        # an identical regeneration skips the editor entirely.
+        self._last_parts_gl: list[str] | None = None
+        self._last_parts_ce: list[str] | None = None
+        # Scene ids touched since each editor was last filled, plus the scene
+        # order it was filled with; both unchanged means nothing to do.
+        self._dirty_gl: set[int] = set()
+        self._dirty_ce: set[int] = set()
+        self._last_ids_gl: tuple[int, ...] = ()
+        self._last_ids_ce: tuple[int, ...] = ()
         self._code_gl_manual = False
         self._code_ce_manual = False
         self._updating_code = False
         self._code_sync_timer = QTimer(self)
         self._code_sync_timer.setSingleShot(True)
         self._code_sync_timer.timeout.connect(self._apply_code_to_canvas)
+        # Edits and tab flicks in quick succession collapse into one refresh
+        self._code_refresh_timer = QTimer(self)
+        self._code_refresh_timer.setSingleShot(True)
+        self._code_refresh_timer.setInterval(50)
+        self._code_refresh_timer.timeout.connect(self._refresh_code_editors)
         self.codeEditor.textChanged.connect(self._on_code_gl_edited)
         self.codeEditorCE.textChanged.connect(self._on_code_ce_edited)
         self.centerTabBar.currentChanged.connect(self._on_center_tab_changed)
@@ -626,23 +1006,23 @@ class ManimComposerWindow(QMainWindow):
         if isinstance(focused, QPlainTextEdit):
             focused.copy()
             return
-        selected = self.canvas_scene.selectedItems()
-        if len(selected) != 1:
-            return
-        name = self.scene_state.find_name_for_item(selected[0])
-        if not name:
-            return
-        tracked = self.scene_state.get_tracked(name)
-        if not tracked or tracked.obj_type != "mathtex":
+        clips = []
+        for item in self.canvas_scene.selectedItems():
+            name = self.scene_state.find_name_for_item(item)
+            if not name:
+                continue
+            tracked = self.scene_state.get_tracked(name)
+            if not tracked or tracked.obj_type != "mathtex":
+                continue
+            pos = item.pos()
+            clips.append(_Clip(
+                latex=tracked.latex, color=tracked.color,
+                font_size=tracked.font_size,
+                pos_x=pos.x(), pos_y=pos.y(),
+            ))
+        if not clips:
             return
-        pos = selected[0].pos()
-        self._clipboard = {
-            "latex": tracked.latex,
-            "color": tracked.color,
-            "font_size": tracked.font_size,
-            "pos_x": pos.x(),
-            "pos_y": pos.y(),
-        }
+        self._clipboard = clips
         self.statusBar.showMessage("Copied", 2000)
 
     def _paste_clipboard(self):
@@ -652,29 +1032,35 @@ class ManimComposerWindow(QMainWindow):
             return
         if not self._clipboard:
             return
-        cb = self._clipboard
+        first = self._clipboard[0]
 
-        # Paste at cursor if it's inside the scene rect, otherwise offset from original
+        # Paste at cursor if it's inside the scene rect, otherwise offset from original.
+        # Multiple items keep their layout relative to the first one.
         cursor_scene = self.canvasView.mapToScene(
             self.canvasView.mapFromGlobal(QCursor.pos())
         )
         if self.canvas_scene.sceneRect().contains(cursor_scene):
-            paste_pos = cursor_scene
+            dx = cursor_scene.x() - first.pos_x
+            dy = cursor_scene.y() - first.pos_y
         else:
-            paste_pos = QPointF(cb["pos_x"] + 30, cb["pos_y"] - 30)
+            dx, dy = 30.0, -30.0
 
-        name = self.scene_state.next_name("eq")
-        item = MathTexItem(latex=cb["latex"], color=cb["color"], font_size=cb["font_size"])
-        self.canvas_scene.addItem(item)
-        item.setPos(paste_pos)
-        tracked = TrackedObject(
-            name=name, obj_type="mathtex",
-            latex=cb["latex"], color=cb["color"], font_size=cb["font_size"],
-        )
-        self.scene_state.register(name, tracked, item)
         self.canvas_scene.clearSelection()
-        item.setSelected(True)
-        self.statusBar.showMessage(f"Pasted as {name}", 2000)
+        names = []
+        for cb in self._clipboard:
+            name = self.scene_state.next_name("eq")
+            item = MathTexItem(latex=cb.latex, color=cb.color, font_size=cb.font_size)
+            self._add_canvas_item(item)
+            item.setPos(QPointF(cb.pos_x + dx, cb.pos_y + dy))
+            tracked = TrackedObject(
+                name=name, obj_type="mathtex",
+                latex=cb.latex, color=cb.color, font_size=cb.font_size,
+            )
+            self.scene_state.register(name, tracked, item)
+            item.setSelected(True)
+            names.append(name)
+        self._touch_scene()
+        self.statusBar.showMessage(f"Pasted as {', '.join(names)}", 2000)
 
     def _delete_selected(self):
         focused = QApplication.focusWidget()
@@ -689,6 +1075,7 @@ class ManimComposerWindow(QMainWindow):
             if name:
                 self.scene_state.unregister(name)
             self.canvas_scene.removeItem(item)
+        self._touch_scene()
         self._refresh_animations_list()
 
     def _select_all(self):
@@ -703,10 +1090,50 @@ class ManimComposerWindow(QMainWindow):
             if item:
                 item.setSelected(True)
 
+    def _process_env(self) -> QProcessEnvironment:
+        """Environment for preview/render processes (built on first use)."""
+        if self._proc_env is None:
+            # Always use TinyTeX env so it shadows system LaTeX
+            qenv = QProcessEnvironment()
+            for k, v in latex_manager.get_latex_env().items():
+                qenv.insert(k, v)
+            self._proc_env = qenv
+        return self._proc_env
+
     def _setup_preview(self):
         """Wire Preview button, Render buttons, Dock toggle, and Export to .py."""
         self._dock_hwnd = None
+        self._dock_sync_timer = QTimer(self)
+        self._dock_sync_timer.setSingleShot(True)
+        self._dock_sync_timer.setInterval(16)
+        self._dock_sync_timer.timeout.connect(self._sync_dock_position)
         self._render_proc = None
+        # Interpreter and environment for child processes, resolved once
+        self._py_exe = sys.executable
+        # WinEvent hook that docks the preview once its window is shown
+        self._autodock_hook = None
+        self._autodock_proc = None
+        # Preview window title -> HWND, valid for the current preview process
+        self._hwnd_cache: dict[str, int] = {}
+        # Launcher script is identical across previews; written on first launch
+        self._launcher_written = False
+        self._replay_writer: _LatestFileWriter | None = None
+        self._proc_env: QProcessEnvironment | None = None
+        self._preview_log_path: str | None = None
+        self._log_tail = 0
+        self.consolePane.setMaximumBlockCount(_CONSOLE_MAX_BLOCKS)
+        # Raw console output is coalesced and decoded/flushed at most once per frame
+        self._console_pending = bytearray()
+        self._console_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._console_timer = QTimer(self)
+        self._console_timer.setSingleShot(True)
+        self._console_timer.setInterval(16)
+        self._console_timer.timeout.connect(self._flush_console)
+        # Runs while a preview is alive: streams its log to a shown Console tab
+        # and keeps the log file below _PREVIEW_LOG_MAX
+        self._log_poll_timer = QTimer(self)
+        self._log_poll_timer.setInterval(100)
+        self._log_poll_timer.timeout.connect(self._poll_preview_log)
         self.btnPreviewScene.clicked.connect(self._preview_scene)
         self.btnRenderScene.clicked.connect(self._render_current_scene)
         self.btnRenderAll.clicked.connect(self._render_all_scenes)
@@ -723,6 +1150,9 @@ class ManimComposerWindow(QMainWindow):
             self._preview_proc.kill()
             self._preview_proc.waitForFinished(3000)
         self._preview_proc = None
+        self._stop_autodock_hook()
+        self._hwnd_cache.clear()
+        self._rotate_preview_log()
         self._dock_hwnd = None
         self.btnDockPreview.setChecked(False)
 
@@ -737,8 +1167,7 @@ class ManimComposerWindow(QMainWindow):
             self.btnDockPreview.setChecked(False)
             return
 
-        import ctypes
-        hwnd = ctypes.windll.user32.FindWindowW(None, self._current_scene_name())
+        hwnd = self._lookup_hwnd(self._current_scene_name())
         if not hwnd:
             self.statusBar.showMessage("Preview window not found", 3000)
             self.btnDockPreview.setChecked(False)
@@ -753,21 +1182,28 @@ class ManimComposerWindow(QMainWindow):
         if not self._dock_hwnd:
             return
         import ctypes
+        SWP_NOZORDER = 0x0004
+        SWP_NOACTIVATE = 0x0010
         frame = self.frameGeometry()
-        ctypes.windll.user32.MoveWindow(
-            self._dock_hwnd,
+        ctypes.windll.user32.SetWindowPos(
+            self._dock_hwnd, None,
             frame.right() + 1, frame.top(),
             frame.width(), frame.height(),
-            True,
+            SWP_NOZORDER | SWP_NOACTIVATE,
         )
 
+    def _request_dock_sync(self):
+        """Follow the main window at most once per frame while it is dragged/resized."""
+        if self._dock_hwnd and not self._dock_sync_timer.isActive():
+            self._dock_sync_timer.start()
+
     def moveEvent(self, event):
         super().moveEvent(event)
-        self._sync_dock_position()
+        self._request_dock_sync()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._sync_dock_position()
+        self._request_dock_sync()
 
     def _preview_scene(self):
         """Launch or hot-reload the manimgl preview."""
@@ -780,20 +1216,34 @@ class ManimComposerWindow(QMainWindow):
     def _focus_preview(self):
         """Bring the ManimGL preview window to the foreground."""
         import ctypes
-        hwnd = self._dock_hwnd
-        if not hwnd:
-            hwnd = ctypes.windll.user32.FindWindowW(None, self._current_scene_name())
+        hwnd = self._dock_hwnd or self._lookup_hwnd(self._current_scene_name())
         if hwnd:
             ctypes.windll.user32.SetForegroundWindow(hwnd)
 
+    def _lookup_hwnd(self, title: str) -> int:
+        """Find the preview window by title, reusing the last handle while it is valid."""
+        import ctypes
+        user32 = ctypes.windll.user32
+        hwnd = self._hwnd_cache.get(title)
+        if hwnd and user32.IsWindow(hwnd):
+            return hwnd
+        hwnd = user32.FindWindowW(None, title)
+        if hwnd:
+            self._hwnd_cache[title] = hwnd
+        return hwnd
+
     def _launch_preview(self):
         """First launch: spawn manimgl with hot-reload support."""
         tmp_dir = tempfile.gettempdir()
         tmp = os.path.join(tmp_dir, "manim_composer_preview.py")
         launcher = os.path.join(tmp_dir, "manim_composer_launcher.py")
         replay_file = os.path.join(tmp_dir, "manim_composer_replay.py")
+        log_file = os.path.join(tmp_dir, "manim_composer_preview.log")
 
-        # Remove stale replay file so the watcher doesn't fire immediately
+        # Remove stale replay file so the watcher doesn't fire immediately;
+        # a queued replay write must not recreate it afterwards
+        if self._replay_writer is not None:
+            self._replay_writer.cancel()
         try:
             os.remove(replay_file)
         except FileNotFoundError:
@@ -804,7 +1254,7 @@ class ManimComposerWindow(QMainWindow):
             # User has manually edited GL code — use it as-is
             code = self.codeEditor.toPlainText()
         else:
-            bg_color = self._scenes[self._current_scene_idx].get("bg_color", "#000000")
+            bg_color = self._current_scene.get("bg_color", "#000000")
             code = generate_manimgl_code(
                 self.scene_state, scene_name=scene_name,
                 interactive=True,
@@ -812,62 +1262,96 @@ class ManimComposerWindow(QMainWindow):
                 bg_color=bg_color,
             )
 
-        with open(tmp, "w", encoding="utf-8") as f:
-            f.write(code)
-
-        # Position preview window to the right of the Composer
-        frame = self.frameGeometry()
-        with open(launcher, "w", encoding="utf-8") as f:
-            f.write(_LAUNCHER_TEMPLATE.format(
-                scene_file=tmp.replace("\\", "/"),
-                scene_name=scene_name,
-                win_x=frame.right() + 1,
-                win_y=frame.top(),
-            ))
+        _write_text(tmp, code)
+        # The launcher is fixed; per-launch settings travel as argv
+        if not self._launcher_written or not os.path.exists(launcher):
+            _write_text(launcher, _LAUNCHER_SCRIPT)
+            self._launcher_written = True
 
         self.statusBar.showMessage("Launching manimgl preview…")
-        self.consolePane.clear()
+        self._clear_console()
 
         proc = QProcess(self)
         proc.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
-        # Always use TinyTeX env so it shadows system LaTeX
-        qenv = QProcessEnvironment()
-        for k, v in latex_manager.get_latex_env().items():
-            qenv.insert(k, v)
-        proc.setProcessEnvironment(qenv)
-        proc.readyReadStandardOutput.connect(self._read_preview_output)
+        proc.setProcessEnvironment(self._process_env())
+        # Output goes straight to a log file; it is only read into the
+        # Console pane while that tab is shown or when the preview exits.
+        # Appending keeps the child writing at the end after we truncate it.
+        self._preview_log_path = log_file
+        self._rotate_preview_log()
+        proc.setStandardOutputFile(log_file, QIODevice.OpenModeFlag.Append)
         proc.finished.connect(self._on_preview_finished)
         proc.errorOccurred.connect(self._on_preview_error)
-        proc.start(sys.executable, [launcher])
+        # Position preview window to the right of the Composer
+        frame = self.frameGeometry()
+        proc.start(self._py_exe, [
+            launcher, tmp.replace("\\", "/"), scene_name,
+            str(frame.right() + 1), str(frame.top()),
+        ])
         self._preview_proc = proc
+        self._log_poll_timer.start()
+
+        # Auto-dock as soon as the GL window appears
+        self._start_autodock_hook(scene_name)
 
-        # Auto-dock after the GL window appears
-        self._autodock_attempts = 0
-        self._autodock_timer = QTimer(self)
-        self._autodock_timer.timeout.connect(self._try_autodock)
-        self._autodock_timer.start(500)
-
-    def _try_autodock(self):
-        """Poll for the ManimGL window and auto-dock it once found."""
-        self._autodock_attempts += 1
-        if self._autodock_attempts > 20:  # Give up after 10 seconds
-            self._autodock_timer.stop()
+    def _start_autodock_hook(self, title: str):
+        """Dock the preview when Windows reports its window shown (no polling)."""
+        self._stop_autodock_hook()
+        if sys.platform != "win32":
             return
         import ctypes
-        hwnd = ctypes.windll.user32.FindWindowW(None, self._current_scene_name())
-        if hwnd:
-            self._autodock_timer.stop()
-            self.btnDockPreview.setChecked(True)
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+        EVENT_OBJECT_SHOW = 0x8002
+        WINEVENT_OUTOFCONTEXT = 0x0000
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD,
+        )
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD,
+        ]
+        buf = ctypes.create_unicode_buffer(256)
+
+        def on_show(_hook, _event, hwnd, id_object, id_child, _thread, _time):
+            # Out-of-context hooks are delivered on this (GUI) thread's message loop
+            if not hwnd or id_object != 0 or id_child != 0:  # OBJID_WINDOW, CHILDID_SELF
+                return
+            user32.GetWindowTextW(hwnd, buf, len(buf))
+            if buf.value == title:
+                self._hwnd_cache[title] = hwnd
+                self._stop_autodock_hook()
+                QTimer.singleShot(0, lambda: self.btnDockPreview.setChecked(True))
+
+        # The callback object must outlive the hook; it is replaced on the next launch.
+        # Listen to every process: under a venv launcher (e.g. `uv run`) the GL window
+        # belongs to a child of the process we started, so its pid is unknown here.
+        self._autodock_proc = WinEventProc(on_show)
+        self._autodock_hook = user32.SetWinEventHook(
+            EVENT_OBJECT_SHOW, EVENT_OBJECT_SHOW, None, self._autodock_proc,
+            0, 0, WINEVENT_OUTOFCONTEXT,
+        )
+
+    def _stop_autodock_hook(self):
+        """Remove the pending auto-dock hook, if any."""
+        if self._autodock_hook:
+            import ctypes
+            ctypes.windll.user32.UnhookWinEvent(ctypes.c_void_p(self._autodock_hook))
+        self._autodock_hook = None
 
     def _replay_preview(self):
         """Hot-reload: write replay file, the running preview picks it up."""
-        bg_color = self._scenes[self._current_scene_idx].get("bg_color", "#000000")
+        # Generation reads live canvas items, so it stays on the GUI thread;
+        # only the file write goes to the pool.
+        bg_color = self._current_scene.get("bg_color", "#000000")
         replay = generate_replay_code(self.scene_state, bg_color=bg_color)
-        tmp_dir = tempfile.gettempdir()
-        replay_file = os.path.join(tmp_dir, "manim_composer_replay.py")
-
-        with open(replay_file, "w", encoding="utf-8") as f:
-            f.write(replay)
+        if self._replay_writer is None:
+            replay_file = os.path.join(tempfile.gettempdir(), "manim_composer_replay.py")
+            self._replay_writer = _LatestFileWriter(replay_file)
+        # The running preview exec()s this file as soon as its mtime changes
+        self._replay_writer.submit(replay)
 
         self.statusBar.showMessage("Preview updated", 3000)
 
@@ -888,13 +1372,9 @@ class ManimComposerWindow(QMainWindow):
             code = self._generate_all_ce_code()
             names = [s["name"] for s in self._scenes]
         else:
-            scene_name = self._current_scene_name()
-            bg_color = self._scenes[self._current_scene_idx].get("bg_color", "#000000")
-            code = generate_manimce_code(
-                self.scene_state, scene_name=scene_name, include_import=True,
-                bg_color=bg_color,
-            )
-            names = [scene_name]
+            scene = self._current_scene
+            code = generate_manimce_imports() + self._scene_code(scene, ce=True)
+            names = [scene["name"]]
         return code, names
 
     def _render_current_scene(self):
@@ -939,14 +1419,13 @@ class ManimComposerWindow(QMainWindow):
         "        return result\n"
         "    _tfw.convert_to_svg = _convert_to_svg\n"
     )
+    _SVG_PATCH_BYTES = _SVG_PATCH.encode("utf-8")
 
     def _start_render(self, code: str, scene_names: list[str]):
         """Write CE code to temp file and launch manim render."""
         tmp_dir = tempfile.gettempdir()
         render_file = os.path.join(tmp_dir, "manim_composer_render.py")
-        with open(render_file, "w", encoding="utf-8") as f:
-            f.write(self._SVG_PATCH)
-            f.write(code)
+        _write_text(render_file, code, prefix=self._SVG_PATCH_BYTES)
 
         # Read render settings from UI widgets
         quality = self.comboRenderQuality.currentText()
@@ -972,50 +1451,68 @@ class ManimComposerWindow(QMainWindow):
         self._render_scene_names = scene_names
         self._render_media_dir = media_dir
         self._render_format = fmt
+        self._render_stem = os.path.splitext(os.path.basename(render_file))[0]
 
         label = ", ".join(scene_names)
         self.statusBar.showMessage(f"Rendering {label}...")
-        self.consolePane.clear()
+        self._clear_console()
         self.centerTabBar.setCurrentIndex(3)  # Switch to Console tab
 
         proc = QProcess(self)
         proc.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
-        # Always use TinyTeX env so it shadows system LaTeX
-        qenv = QProcessEnvironment()
-        for k, v in latex_manager.get_latex_env().items():
-            qenv.insert(k, v)
-        proc.setProcessEnvironment(qenv)
+        proc.setProcessEnvironment(self._process_env())
         proc.readyReadStandardOutput.connect(self._read_render_output)
         proc.finished.connect(self._on_render_finished)
         proc.errorOccurred.connect(self._on_render_error)
-        proc.start(sys.executable, ["-m", "manim"] + args)
+        proc.start(self._py_exe, ["-m", "manim"] + args)
         self._render_proc = proc
 
     def _read_render_output(self):
         """Append render output to the Console pane."""
-        data = self._render_proc.readAllStandardOutput()
-        text = bytes(data).decode("utf-8", errors="replace")
-        cursor = self.consolePane.textCursor()
+        self._queue_console(bytes(self._render_proc.readAllStandardOutput()))
+
+    def _queue_console(self, data: bytes):
+        """Queue raw UTF-8 output for the Console pane; flushed on the next frame tick."""
+        self._console_pending += data
+        if not self._console_timer.isActive():
+            self._console_timer.start()
+
+    def _append_console(self, text: str):
+        """Queue a message of our own for the Console pane."""
+        self._queue_console(text.encode("utf-8"))
+
+    def _flush_console(self):
+        """Write all queued output to the end of the Console pane and scroll to it."""
+        self._console_timer.stop()
+        if not self._console_pending:
+            return
+        text = self._console_decoder.decode(self._console_pending)
+        self._console_pending.clear()
+        cursor = QTextCursor(self.consolePane.document())
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(text)
-        self.consolePane.setTextCursor(cursor)
-        self.consolePane.ensureCursorVisible()
+        cursor.insertText("".join(_wrap_long_lines(text)))
+        bar = self.consolePane.verticalScrollBar()
+        bar.setValue(bar.maximum())
+
+    def _clear_console(self):
+        """Empty the Console pane and drop any queued output."""
+        self._console_timer.stop()
+        self._console_pending.clear()
+        self._console_decoder.reset()
+        self.consolePane.clear()
 
     def _on_render_finished(self, exit_code, _exit_status):
         """Handle render process completion."""
-        cursor = self.consolePane.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
         if exit_code != 0:
             self.statusBar.showMessage(f"Render failed (exit {exit_code})", 5000)
-            cursor.insertText(f"\n--- Render FAILED (exit code {exit_code}) ---\n")
+            self._append_console(f"\n--- Render FAILED (exit code {exit_code}) ---\n")
         else:
             self.statusBar.showMessage("Render complete!", 5000)
-            cursor.insertText("\n--- Render complete! ---\n")
+            self._append_console("\n--- Render complete! ---\n")
             # Try to open the rendered file(s) if checkbox is checked
             if self.checkOpenOnComplete.isChecked():
                 self._open_rendered_files()
-        self.consolePane.setTextCursor(cursor)
-        self.consolePane.ensureCursorVisible()
+        self._flush_console()
 
     def _open_rendered_files(self):
         """Open rendered video files in the default OS application."""
@@ -1026,18 +1523,32 @@ class ManimComposerWindow(QMainWindow):
             return
         # Manim CE puts videos in media/videos/<filename>/<quality>/SceneName.ext
         # Find the newest matching file for the last rendered scene
-        target_name = scene_names[-1]
-        ext = fmt if fmt != "png" else "png"
+        target = f"{scene_names[-1]}.{fmt}"
         best_path = None
         best_mtime = 0
-        for root, _dirs, files in os.walk(media_dir):
-            for f in files:
-                if f == f"{target_name}.{ext}":
-                    path = os.path.join(root, f)
-                    mtime = os.path.getmtime(path)
-                    if mtime > best_mtime:
-                        best_mtime = mtime
-                        best_path = path
+        # Look only at the quality folders for this render file first
+        kind = "images" if fmt == "png" else "videos"
+        stem = getattr(self, "_render_stem", "manim_composer_render")
+        try:
+            with os.scandir(os.path.join(media_dir, kind, stem)) as qualities:
+                for quality in qualities:
+                    if not quality.is_dir():
+                        continue
+                    with os.scandir(quality.path) as entries:
+                        for entry in entries:
+                            if entry.name == target and entry.is_file():
+                                mtime = entry.stat().st_mtime
+                                if mtime > best_mtime:
+                                    best_mtime = mtime
+                                    best_path = entry.path
+        except FileNotFoundError:
+            pass
+        if best_path is None:
+            # Unexpected layout: search the whole media dir
+            pattern = os.path.join(glob.escape(media_dir), "**", glob.escape(target))
+            best_path = max(
+                glob.iglob(pattern, recursive=True), key=os.path.getmtime, default=None,
+            )
         if best_path:
             os.startfile(best_path)
 
@@ -1048,18 +1559,62 @@ class ManimComposerWindow(QMainWindow):
                 "Failed to start render — check Manim CE installation (pip install manim)", 5000
             )
 
-    def _read_preview_output(self):
-        """Append new output from the preview process to the Console pane."""
-        data = self._preview_proc.readAllStandardOutput()
-        text = bytes(data).decode("utf-8", errors="replace")
-        cursor = self.consolePane.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(text)
-        self.consolePane.setTextCursor(cursor)
-        self.consolePane.ensureCursorVisible()
+    def _pull_preview_log(self):
+        """Append preview output logged since the last pull to the Console pane.
+
+        Once the log passes _PREVIEW_LOG_MAX it is emptied right after being
+        read, so a long-running preview doesn't grow it without bound.
+        """
+        path = self._preview_log_path
+        if not path:
+            return
+        try:
+            with open(path, "r+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size < self._log_tail:  # file was truncated
+                    self._log_tail = 0
+                start = max(self._log_tail, size - _PREVIEW_LOG_TAIL_MAX)
+                f.seek(start)
+                data = f.read()
+                self._log_tail = start + len(data)
+                if self._log_tail >= _PREVIEW_LOG_MAX:
+                    f.truncate(0)
+                    self._log_tail = 0
+        except OSError:
+            return
+        if data:
+            self._queue_console(data)
+
+    def _poll_preview_log(self):
+        """Stream preview output to a shown Console tab; otherwise just cap the log."""
+        if not self._preview_alive():
+            self._log_poll_timer.stop()
+            return
+        if self.centerTabBar.currentIndex() != 3:
+            try:
+                if os.path.getsize(self._preview_log_path) < _PREVIEW_LOG_MAX:
+                    return
+            except OSError:
+                return
+        self._pull_preview_log()
+
+    def _rotate_preview_log(self):
+        """Truncate the preview log so it doesn't grow across sessions."""
+        if self._preview_log_path:
+            try:
+                open(self._preview_log_path, "wb").close()
+            except OSError:
+                pass
+        self._log_tail = 0
 
     def _on_preview_finished(self, exit_code, _exit_status):
         """Handle preview process exit."""
+        self._log_poll_timer.stop()
+        self._pull_preview_log()
+        self._flush_console()
+        self._rotate_preview_log()
+        self._stop_autodock_hook()
+        self._hwnd_cache.clear()
         self._dock_hwnd = None
         self.btnDockPreview.setChecked(False)
         if exit_code != 0:
@@ -1078,11 +1633,7 @@ class ManimComposerWindow(QMainWindow):
                     "  3. Use 'Render' instead of 'Preview' (renders to file, "
                     "no GPU needed)\n"
                 )
-                cursor = self.consolePane.textCursor()
-                cursor.movePosition(QTextCursor.MoveOperation.End)
-                cursor.insertText(msg)
-                self.consolePane.setTextCursor(cursor)
-                self.consolePane.ensureCursorVisible()
+                self._append_console(msg)
             else:
                 self.statusBar.showMessage(f"Preview failed (exit {exit_code})", 5000)
         else:
@@ -1097,18 +1648,30 @@ class ManimComposerWindow(QMainWindow):
 
     def _export_py(self):
         """File → Export to .py"""
-        from PyQt6.QtWidgets import QFileDialog
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Export ManimGL Script", "scene.py",
-            "Python Files (*.py);;All Files (*)",
-        )
-        if path:
-            if self._code_gl_manual:
-                code = self.codeEditor.toPlainText()
-            else:
-                code = self._generate_all_gl_code()
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(code)
+        dialog = self._export_dialog
+        if dialog is None:
+            # Built once and reused so it opens faster and keeps its folder
+            dialog = QFileDialog(self, "Export ManimGL Script")
+            dialog.setNameFilter("Python Files (*.py);;All Files (*)")
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setDefaultSuffix("py")
+            dialog.selectFile("scene.py")
+            self._export_dialog = dialog
+        if self._last_export_dir:
+            dialog.setDirectory(self._last_export_dir)
+        if dialog.exec() and dialog.selectedFiles():
+            path = dialog.selectedFiles()[0]
+            self._last_export_dir = os.path.dirname(path)
+            with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                if self._code_gl_manual:
+                    f.write(self.codeEditor.toPlainText())
+                else:
+                    # Write scene by scene instead of joining the whole script first
+                    f.write(generate_manimgl_imports())
+                    for i, scene in enumerate(self._scenes):
+                        if i:
+                            f.write("\n")
+                        f.write(self._scene_code(scene))
             self.statusBar.showMessage(f"Exported to {path}", 5000)
 
     def _setup_syntax_highlighting(self):
@@ -1117,44 +1680,141 @@ class ManimComposerWindow(QMainWindow):
         self._highlighter_code_editor_ce = PythonHighlighter(self.codeEditorCE.document())
 
     def _on_center_tab_changed(self, index: int):
-        """Regenerate code when switching to a Code tab."""
+        """Regenerate code when switching to a Code tab; pull preview output for Console."""
         if index in (1, 2):
-            self._refresh_code_editors()
+            if not self._code_is_current(index):
+                self._request_code_refresh()
+        elif index == 3:
+            self._pull_preview_log()
+
+    def _scene_code(self, scene: dict, ce: bool = False) -> str:
+        """Generate (or reuse cached) ManimGL/CE code for one scene, without imports."""
+        bg_color = scene.get("bg_color", "#000000")
+        key = (scene["id"], scene["rev"], scene["name"], bg_color)
+        cache = self._code_cache_ce if ce else self._code_cache_gl
+        code = cache.get(key)
+        if code is None:
+            generate = generate_manimce_code if ce else generate_manimgl_code
+            code = generate(
+                scene["state"], scene_name=scene["name"],
+                include_import=False, bg_color=bg_color,
+            )
+            if len(cache) >= _CODE_CACHE_MAX:
+                del cache[next(iter(cache))]  # evict the oldest entry
+            cache[key] = code
+        return code
+
+    def _all_scene_code(self, ce: bool = False) -> list[str]:
+        """Generated code for every scene, one entry per scene.
+
+        The import preamble is prepended to the first entry, so joining the
+        entries with newlines gives the complete script.
+        """
+        # Deliberately serial on the GUI thread: the generators read live
+        # QGraphicsItem positions (not thread-safe) and are pure Python, so
+        # a worker pool would only add GIL contention. Unchanged scenes are
+        # cache hits, which leaves just the modified ones to generate.
+        parts = [self._scene_code(scene, ce=ce) for scene in self._scenes]
+        if parts:
+            imports = generate_manimce_imports() if ce else generate_manimgl_imports()
+            parts[0] = imports + parts[0]
+        return parts
 
     def _generate_all_gl_code(self) -> str:
         """Generate ManimGL code for all scenes."""
-        parts = []
-        for i, scene in enumerate(self._scenes):
-            code = generate_manimgl_code(
-                scene["state"], scene_name=scene["name"],
-                include_import=(i == 0),
-                bg_color=scene.get("bg_color", "#000000"),
-            )
-            parts.append(code)
-        return "\n".join(parts)
+        return "\n".join(self._all_scene_code())
 
     def _generate_all_ce_code(self) -> str:
         """Generate Manim CE code for all scenes."""
-        parts = []
-        for i, scene in enumerate(self._scenes):
-            code = generate_manimce_code(
-                scene["state"], scene_name=scene["name"],
-                include_import=(i == 0),
-                bg_color=scene.get("bg_color", "#000000"),
-            )
-            parts.append(code)
-        return "\n".join(parts)
+        return "\n".join(self._all_scene_code(ce=True))
+
+    @staticmethod
+    def _patch_editor(editor, old_parts: list[str] | None, new_parts: list[str]):
+        """Rewrite only the changed span of scenes in *editor*.
+
+        Unchanged leading/trailing scenes are left alone, so the highlighter
+        only re-runs on the blocks that were actually replaced.
+        """
+        new_text = "\n".join(new_parts)
+        doc = editor.document()
+        old_text = "\n".join(old_parts) if old_parts is not None else None
+        if old_text is None or doc.characterCount() - 1 != _utf16_len(old_text):
+            editor.setPlainText(new_text)
+            return
+
+        n_old, n_new = len(old_parts), len(new_parts)
+        limit = min(n_old, n_new)
+        lo = 0
+        while lo < limit and old_parts[lo] == new_parts[lo]:
+            lo += 1
+        if lo == n_old == n_new:
+            return
+        tail = 0
+        while tail < limit - lo and old_parts[n_old - 1 - tail] == new_parts[n_new - 1 - tail]:
+            tail += 1
+
+        prefix = "\n".join(old_parts[:lo])
+        suffix = "\n".join(old_parts[n_old - tail:])
+        new_mid = new_text[len(prefix):len(new_text) - len(suffix)]
+        start = _utf16_len(prefix)
+        end = _utf16_len(old_text) - _utf16_len(suffix)
+
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(new_mid)
+        cursor.endEditBlock()
+
+    def _request_code_refresh(self):
+        """Schedule a code editor refresh; calls within 50 ms coalesce."""
+        self._code_refresh_timer.start()
+
+    def _code_is_current(self, index: int) -> bool:
+        """True if the editor on tab *index* already shows code for the current scenes."""
+        ids = tuple(scene["id"] for scene in self._scenes)
+        if index == 1:
+            return self._code_gl_manual or not (
+                self._dirty_gl or ids != self._last_ids_gl or self._last_parts_gl is None)
+        return self._code_ce_manual or not (
+            self._dirty_ce or ids != self._last_ids_ce or self._last_parts_ce is None)
 
     def _refresh_code_editors(self):
         """Update the visible code editor with all scenes (unless manually edited)."""
-        self._updating_code = True
         index = self.centerTabBar.currentIndex()
-        if index == 1 and not self._code_gl_manual:  # Code GL tab
-            self.codeEditor.setPlainText(self._generate_all_gl_code())
-        elif index == 2 and not self._code_ce_manual:  # Code CE tab
-            self.codeEditorCE.setPlainText(self._generate_all_ce_code())
+        if index not in (1, 2) or self._code_is_current(index):
+            return
+        self._updating_code = True
+        ids = tuple(scene["id"] for scene in self._scenes)
+        if index == 1:  # Code GL tab
+            # Clean scenes come straight from the code cache
+            parts = self._all_scene_code()
+            if parts != self._last_parts_gl:
+                self._gate_highlighter(self._highlighter_code_editor, self.codeEditor, parts)
+                self._patch_editor(self.codeEditor, self._last_parts_gl, parts)
+                self._last_parts_gl = parts
+            self._last_ids_gl = ids
+            self._dirty_gl.clear()
+        else:  # Code CE tab
+            parts = self._all_scene_code(ce=True)
+            if parts != self._last_parts_ce:
+                self._gate_highlighter(self._highlighter_code_editor_ce, self.codeEditorCE, parts)
+                self._patch_editor(self.codeEditorCE, self._last_parts_ce, parts)
+                self._last_parts_ce = parts
+            self._last_ids_ce = ids
+            self._dirty_ce.clear()
         self._updating_code = False
 
+    def _gate_highlighter(self, highlighter, editor, parts: list[str]):
+        """Detach *highlighter* while the generated code is huge; re-attach when it shrinks."""
+        size = sum(len(p.encode("utf-8", "ignore")) + 1 for p in parts)
+        attached = highlighter.document() is not None
+        if size > _LARGE_DOC_BYTES and attached:
+            highlighter.setDocument(None)
+            self.statusBar.showMessage("Syntax highlighting disabled for large document", 5000)
+        elif size <= _LARGE_DOC_BYTES and not attached:
+            highlighter.setDocument(editor.document())
+
     # --- Code → Canvas sync ---
 
     def _apply_code_to_canvas(self):
@@ -1186,68 +1846,74 @@ class ManimComposerWindow(QMainWindow):
 
         self._updating_code = True
         state = self.scene_state
-        parsed_names = {obj.name for obj in parsed.objects}
-        current_names = set(state.object_names())
-
-        # --- Update / add objects ---
-        for pobj in parsed.objects:
-            tracked = state.get_tracked(pobj.name)
-            item = state.get_item(pobj.name)
-
-            if tracked and item:
-                # Update existing object
-                if tracked.latex != pobj.latex:
-                    tracked.latex = pobj.latex
-                    item.set_latex(pobj.latex)
-                if tracked.color.upper() != pobj.color.upper():
-                    tracked.color = pobj.color
-                    item.set_color(pobj.color)
-                if tracked.font_size != pobj.font_size:
-                    tracked.font_size = pobj.font_size
-                    item.set_font_size(pobj.font_size)
-                # Position (manim → scene coords)
-                new_sx = pobj.pos_x * 100.0
-                new_sy = -pobj.pos_y * 100.0
-                pos = item.pos()
-                if abs(pos.x() - new_sx) > 0.5 or abs(pos.y() - new_sy) > 0.5:
-                    item.setPos(new_sx, new_sy)
-            else:
-                # New object from code
-                new_item = MathTexItem(
-                    latex=pobj.latex, color=pobj.color,
-                    font_size=pobj.font_size,
-                )
-                self.canvas_scene.addItem(new_item)
-                new_item.setPos(pobj.pos_x * 100.0, -pobj.pos_y * 100.0)
-                new_tracked = TrackedObject(
-                    name=pobj.name, obj_type="mathtex",
-                    latex=pobj.latex, color=pobj.color,
-                    font_size=pobj.font_size,
-                )
-                state.register(pobj.name, new_tracked, new_item)
+        # What the animations list shows now, to diff against after the sync
+        shown_anims = [_anim_key(a) for a in state.all_animations()]
+        removed_names = state.object_names() - parsed.names  # a new set, safe to keep
+
+        # Add/remove items as one batch: no per-item selection signals or repaints
+        view = self.canvasView
+        view.setUpdatesEnabled(False)
+        self.canvas_scene.blockSignals(True)
+        try:
+            # --- Update / add objects ---
+            objects, items = state.objects, state.items
+            for pobj in parsed.objects:
+                tracked = objects.get(pobj.name)
+                item = items.get(pobj.name)
+
+                if tracked and item:
+                    # Update existing object
+                    if tracked.latex != pobj.latex:
+                        tracked.latex = pobj.latex
+                        item.set_latex(pobj.latex)
+                    if tracked.color != pobj.color:
+                        tracked.color = pobj.color
+                        item.set_color(pobj.color)
+                    if tracked.font_size != pobj.font_size:
+                        tracked.font_size = pobj.font_size
+                        item.set_font_size(pobj.font_size)
+                    # Position (manim → scene coords)
+                    new_sx = pobj.pos_x * 100.0
+                    new_sy = -pobj.pos_y * 100.0
+                    pos = item.pos()
+                    if abs(pos.x() - new_sx) > 0.5 or abs(pos.y() - new_sy) > 0.5:
+                        item.setPos(new_sx, new_sy)
+                else:
+                    # New object from code
+                    new_item = MathTexItem(
+                        latex=pobj.latex, color=pobj.color,
+                        font_size=pobj.font_size,
+                    )
+                    self._add_canvas_item(new_item)
+                    new_item.setPos(pobj.pos_x * 100.0, -pobj.pos_y * 100.0)
+                    new_tracked = TrackedObject(
+                        name=pobj.name, obj_type="mathtex",
+                        latex=pobj.latex, color=pobj.color,
+                        font_size=pobj.font_size,
+                    )
+                    state.register(pobj.name, new_tracked, new_item)
 
-        # --- Remove deleted objects ---
-        for name in current_names - parsed_names:
-            item = state.get_item(name)
-            state.unregister(name)
-            if item:
-                self.canvas_scene.removeItem(item)
+            # --- Remove deleted objects ---
+            for name in removed_names:
+                item = items.get(name)
+                state.unregister(name)
+                if item:
+                    self.canvas_scene.removeItem(item)
+        finally:
+            self.canvas_scene.blockSignals(False)
+            view.setUpdatesEnabled(True)
+            view.viewport().update()
 
         # --- Sync animations ---
-        state._animations.clear()
-        for panim in parsed.animations:
-            state.add_animation(AnimationEntry(
-                target_name=panim.target_name,
-                anim_type=panim.anim_type,
-                duration=panim.duration,
-                easing=panim.easing,
-            ))
+        parsed_anims = [_anim_key(a) for a in parsed.animations]
+        if parsed_anims != [_anim_key(a) for a in state.all_animations()]:
+            state._animations[:] = [AnimationEntry(*key) for key in parsed_anims]
 
         # --- Sync scene metadata ---
-        scene_data = self._scenes[self._current_scene_idx]
-        if parsed.bg_color.upper() != scene_data.get("bg_color", "#000000").upper():
+        scene_data = self._current_scene
+        if parsed.bg_color != scene_data.get("bg_color", "#000000"):
             scene_data["bg_color"] = parsed.bg_color
-            self.canvas_scene.setBackgroundBrush(QBrush(QColor(parsed.bg_color)))
+            self._set_canvas_bg(parsed.bg_color)
         if parsed.name != scene_data["name"]:
             scene_data["name"] = parsed.name
             self._updating_scenes = True
@@ -1255,7 +1921,14 @@ class ManimComposerWindow(QMainWindow):
             self._updating_scenes = False
 
         # Refresh UI
-        self._refresh_animations_list()
+        self._touch_scene()
+        if parsed_anims != shown_anims:
+            # Only rows from the first changed animation on are rebuilt
+            limit = min(len(parsed_anims), len(shown_anims))
+            first = 0
+            while first < limit and parsed_anims[first] == shown_anims[first]:
+                first += 1
+            self._refresh_animations_list(first)
         # Update properties panel if an object is selected
         ctrl = self.props_controller
         if ctrl._current_name:
@@ -1294,12 +1967,24 @@ def _apply_dark_theme(app: QApplication):
 
 def main():
     import signal
+    import socket
     app = QApplication(sys.argv)
     app.setApplicationName("Manim Composer")
     _apply_dark_theme(app)
+    # Cached pixmaps must not outlive the QApplication
+    app.aboutToQuit.connect(clear_render_caches)
 
-    # Let Ctrl+C close the app gracefully
+    # Let Ctrl+C close the app gracefully.  Python only runs signal handlers
+    # once the interpreter regains control, which doesn't happen while Qt sits
+    # in exec() — so the C-level handler writes to a socket that wakes Qt.
+    # (A socket pair rather than os.pipe so this also works on Windows.)
     signal.signal(signal.SIGINT, lambda *_: app.quit())
+    wake_r, wake_w = socket.socketpair()
+    wake_r.setblocking(False)
+    wake_w.setblocking(False)
+    signal.set_wakeup_fd(wake_w.fileno())
+    wake_notifier = QSocketNotifier(wake_r.fileno(), QSocketNotifier.Type.Read)
+    wake_notifier.activated.connect(lambda *_: wake_r.recv(4096))
 
     # Put TinyTeX at the front of PATH before anything tries to render LaTeX.
     # TinyTeX is installed by the PowerShell installer — not at runtime.
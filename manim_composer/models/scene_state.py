@@ -1,5 +1,6 @@
 """Scene state — central data model for the MVP."""
 
+from collections.abc import KeysView, Mapping
 from dataclasses import dataclass
 
 
@@ -9,9 +10,13 @@ class TrackedObject:
     name: str        # e.g. "eq_1", "eq_2"
     obj_type: str    # "mathtex" for now
     latex: str
-    color: str       # hex, e.g. "#FFFFFF"
+    color: str       # hex, stored lowercase, e.g. "#ffffff"
     font_size: int = 48  # UI font size; scale = font_size / 48
 
+    def __post_init__(self):
+        # One canonical spelling, so color comparisons are plain ==
+        self.color = self.color.lower()
+
 
 @dataclass
 class AnimationEntry:
@@ -28,6 +33,8 @@ class SceneState:
     def __init__(self):
         self._objects: dict[str, TrackedObject] = {}
         self._items: dict[str, object] = {}  # name -> QGraphicsItem
+        # id(item) -> name; ids stay unique because _items keeps items alive
+        self._item_to_name: dict[int, str] = {}
         self._animations: list[AnimationEntry] = []
         self._name_counters: dict[str, int] = {}
 
@@ -39,13 +46,21 @@ class SceneState:
         return f"{prefix}_{count}"
 
     def register(self, name: str, tracked: TrackedObject, item: object) -> None:
+        old_item = self._items.get(name)
+        if old_item is not None:
+            self._item_to_name.pop(id(old_item), None)
         self._objects[name] = tracked
         self._items[name] = item
+        self._item_to_name[id(item)] = name
 
     def unregister(self, name: str) -> None:
         self._objects.pop(name, None)
-        self._items.pop(name, None)
-        self._animations = [a for a in self._animations if a.target_name != name]
+        item = self._items.pop(name, None)
+        if item is not None:
+            self._item_to_name.pop(id(item), None)
+        # Most objects have no animations; only rebuild the list when one does
+        if any(a.target_name == name for a in self._animations):
+            self._animations = [a for a in self._animations if a.target_name != name]
 
     def get_tracked(self, name: str) -> TrackedObject | None:
         return self._objects.get(name)
@@ -54,16 +69,24 @@ class SceneState:
         return self._items.get(name)
 
     def find_name_for_item(self, item: object) -> str | None:
-        for name, registered_item in self._items.items():
-            if registered_item is item:
-                return name
-        return None
+        return self._item_to_name.get(id(item))
 
     def all_objects(self) -> list[tuple[str, TrackedObject]]:
         return list(self._objects.items())
 
-    def object_names(self) -> list[str]:
-        return list(self._objects.keys())
+    def object_names(self) -> KeysView[str]:
+        """Live view of object names (supports set operations; don't mutate while iterating)."""
+        return self._objects.keys()
+
+    @property
+    def objects(self) -> Mapping[str, TrackedObject]:
+        """Read-only access to name -> TrackedObject for hot loops."""
+        return self._objects
+
+    @property
+    def items(self) -> Mapping[str, object]:
+        """Read-only access to name -> QGraphicsItem for hot loops."""
+        return self._items
 
     # --- Animation list ---
 
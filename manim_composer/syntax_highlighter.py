@@ -8,99 +8,136 @@ from PyQt6.QtGui import (
 )
 from PyQt6.QtCore import QRegularExpression
 
+# Block states for strings that span lines (anything else = not inside one)
+_IN_TRIPLE_DOUBLE = 1
+_IN_TRIPLE_SINGLE = 2
+_TRIPLE_DELIMS = {_IN_TRIPLE_DOUBLE: '"""', _IN_TRIPLE_SINGLE: "'''"}
+
+
+def _char_format(color: str, bold: bool = False, italic: bool = False) -> QTextCharFormat:
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    if bold:
+        fmt.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        fmt.setFontItalic(True)
+    return fmt
+
+
+# Formats are value types, so one set is shared by every highlighter
+_KEYWORD_FORMAT = _char_format("#F92672", bold=True)    # pink
+_CLASS_FORMAT = _char_format("#A6E22E", bold=True)      # green
+_FUNCTION_FORMAT = _char_format("#66D9EF")              # cyan
+_STRING_FORMAT = _char_format("#E6DB74")                # yellow
+_COMMENT_FORMAT = _char_format("#75715E", italic=True)  # gray
+_NUMBER_FORMAT = _char_format("#AE81FF")                # purple
+_DECORATOR_FORMAT = _char_format("#F92672")             # pink
+
+_KEYWORDS = (
+    "class", "def", "for", "while",
+    "if", "elif", "else", "return",
+    "import", "from", "as",
+    "try", "except", "finally", "with",
+    "pass", "break", "continue", "raise",
+    "assert", "lambda", "yield",
+    "True", "False", "None",
+    "and", "or", "not", "in", "is",
+    "async", "await", "nonlocal", "global", "del",
+    "match", "case",
+    "self",
+)
 
-class PythonHighlighter(QSyntaxHighlighter):
-    """Syntax highlighter for Python code."""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-
-        # Keyword format
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor("#F92672"))  # pink
-        keyword_format.setFontWeight(QFont.Weight.Bold)
-
-        # Class name format
-        class_format = QTextCharFormat()
-        class_format.setForeground(QColor("#A6E22E"))  # green
-        class_format.setFontWeight(QFont.Weight.Bold)
-
-        # Function format
-        function_format = QTextCharFormat()
-        function_format.setForeground(QColor("#66D9EF"))  # cyan
-
-        # String format
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor("#E6DB74"))  # yellow
-
-        # Comment format
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor("#75715E"))  # gray
-        comment_format.setFontItalic(True)
-
-        # Number format
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor("#AE81FF"))  # purple
-
-        # Decorator format
-        decorator_format = QTextCharFormat()
-        decorator_format.setForeground(QColor("#F92672"))  # pink
-
-        # Keywords
-        keywords = [
-            r"\bclass\b", r"\bdef\b", r"\bfor\b", r"\bwhile\b",
-            r"\bif\b", r"\belif\b", r"\belse\b", r"\breturn\b",
-            r"\bimport\b", r"\bfrom\b", r"\bas\b",
-            r"\btry\b", r"\bexcept\b", r"\bfinally\b", r"\bwith\b",
-            r"\bpass\b", r"\bbreak\b", r"\bcontinue\b", r"\braise\b",
-            r"\bassert\b", r"\blambda\b", r"\byield\b",
-            r"\bTrue\b", r"\bFalse\b", r"\bNone\b",
-            r"\band\b", r"\bor\b", r"\bnot\b", r"\bin\b", r"\bis\b",
-            r"\basync\b", r"\bawait\b", r"\bnonlocal\b", r"\bglobal\b", r"\bdel\b",
-            r"\bmatch\b", r"\bcase\b",
-            r"\bself\b",
-        ]
-
-        # Build regex patterns
-        patterns = []
-
-        # Class names
-        patterns.append((QRegularExpression(r"\bclass\s+(\w+)"), 1, class_format))
-
-        # Function definitions
-        patterns.append((QRegularExpression(r"\bdef\s+(\w+)"), 1, function_format))
-
-        # Function calls
-        patterns.append((QRegularExpression(r"(\w+)(?=\()"), 0, function_format))
+# One alternation, tried in this order at each position: the first token
+# that starts there wins, so e.g. a "#" inside a string stays a string, and
+# keywords and triple quotes inside comments stay comment-coloured.
+_ALTERNATIVES = (
+    # Comments
+    (r"(?<comment>#.*)", {"comment": _COMMENT_FORMAT}),
+    # Triple-quote openers; the rest of the string is found by _highlight_triple
+    (r"""(?<triple>"{3}|'{3})""", {"triple": _STRING_FORMAT}),
+    # Strings
+    (r"""(?<string>"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*')""",
+     {"string": _STRING_FORMAT}),
+    # Decorators
+    (r"(?<decorator>@\w+)", {"decorator": _DECORATOR_FORMAT}),
+    # Class names
+    (r"\b(?<classkw>class)\s+(?<classname>\w+)",
+     {"classkw": _KEYWORD_FORMAT, "classname": _CLASS_FORMAT}),
+    # Function definitions
+    (r"\b(?<defkw>def)\s+(?<defname>\w+)",
+     {"defkw": _KEYWORD_FORMAT, "defname": _FUNCTION_FORMAT}),
+    # Keywords
+    (r"\b(?<keyword>" + "|".join(_KEYWORDS) + r")\b", {"keyword": _KEYWORD_FORMAT}),
+    # Function and method calls
+    (r"(?<call>\.?\w+)(?=\()", {"call": _FUNCTION_FORMAT}),
+    # Numbers
+    (r"(?<number>\b\d+(?:\.\d+)?\b)", {"number": _NUMBER_FORMAT}),
+)
 
-        # Keywords
-        for keyword in keywords:
-            patterns.append((QRegularExpression(keyword), 0, keyword_format))
 
-        # Strings
-        patterns.append((QRegularExpression(r'"[^"\\]*(\\.[^"\\]*)*"'), 0, string_format))
-        patterns.append((QRegularExpression(r"'[^'\\]*(\\.[^'\\]*)*'"), 0, string_format))
+def _compile_pattern():
+    """Build the combined regex and its last-group -> (group, format) pairs table."""
+    pattern = QRegularExpression("|".join(alt for alt, _groups in _ALTERNATIVES))
+    # Compile (and JIT) at import rather than on the first keystroke
+    pattern.optimize()
+    index = {name: i for i, name in enumerate(pattern.namedCaptureGroups()) if name}
+    group_formats = {}
+    for _alt, groups in _ALTERNATIVES:
+        pairs = tuple((index[name], fmt) for name, fmt in groups.items())
+        group_formats[pairs[-1][0]] = pairs
+    return pattern, group_formats
 
-        # Comments
-        patterns.append((QRegularExpression(r"#.*"), 0, comment_format))
 
-        # Numbers
-        patterns.append((QRegularExpression(r"\b\d+(\.\d+)?\b"), 0, number_format))
+_PATTERN, _GROUP_FORMATS = _compile_pattern()
+_TRIPLE_GROUP = _PATTERN.namedCaptureGroups().index("triple")
+_TRIPLE_STATES = {delim: state for state, delim in _TRIPLE_DELIMS.items()}
 
-        # Decorators
-        patterns.append((QRegularExpression(r"@\w+"), 0, decorator_format))
 
-        # Method calls
-        patterns.append((QRegularExpression(r"\.(\w+)(?=\()"), 0, function_format))
+class PythonHighlighter(QSyntaxHighlighter):
+    """Syntax highlighter for Python code."""
 
-        self.rules = patterns
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pattern = _PATTERN
+        self.group_formats = _GROUP_FORMATS
+        self.string_format = _STRING_FORMAT
 
     def highlightBlock(self, text):
-        """Apply syntax highlighting to a block of text."""
-        for pattern, capture, fmt in self.rules:
-            match = pattern.match(text)
-            while match.hasMatch():
-                start = match.capturedStart(capture)
-                length = match.capturedLength(capture)
-                self.setFormat(start, length, fmt)
-                match = pattern.match(text, match.capturedEnd(capture))
+        """Apply syntax highlighting to a block of text.
+
+        Only *text* (the current block) is scanned; strings that continue
+        onto the next line are tracked through the block state.
+        """
+        pattern, group_formats = self.pattern, self.group_formats
+        self.setCurrentBlockState(0)
+        pos = 0
+        state = self.previousBlockState()
+        if state in _TRIPLE_DELIMS:
+            pos = self._highlight_triple(text, state, 0, 0)
+        matches = pattern.globalMatch(text, max(pos, 0))
+        while pos >= 0 and matches.hasNext():
+            match = matches.next()
+            group = match.lastCapturedIndex()
+            if group == _TRIPLE_GROUP:
+                start = match.capturedStart(group)
+                state = _TRIPLE_STATES[match.captured(group)]
+                pos = self._highlight_triple(text, state, start, start + 3)
+                if pos >= 0:
+                    matches = pattern.globalMatch(text, pos)
+                continue
+            for group, fmt in group_formats[group]:
+                self.setFormat(match.capturedStart(group), match.capturedLength(group), fmt)
+
+    def _highlight_triple(self, text, state, start, search_from):
+        """Format a triple-quoted string from *start*; return the index just past it.
+
+        Returns -1 if the string is still open at the end of the block, whose
+        state then carries it over to the next one.
+        """
+        end = text.find(_TRIPLE_DELIMS[state], search_from)
+        if end < 0:
+            self.setFormat(start, len(text) - start, self.string_format)
+            self.setCurrentBlockState(state)
+            return -1
+        self.setFormat(start, end + 3 - start, self.string_format)
+        return end + 3
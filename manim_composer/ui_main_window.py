@@ -0,0 +1,808 @@
+# Form implementation generated from reading ui file 'main_window.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(2046, 1200)
+        self.centralWidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralWidget.setObjectName("centralWidget")
+        self.centralLayout = QtWidgets.QVBoxLayout(self.centralWidget)
+        self.centralLayout.setContentsMargins(0, 0, 0, 0)
+        self.centralLayout.setSpacing(0)
+        self.centralLayout.setObjectName("centralLayout")
+        self.toolbarSelector = QTabBar(parent=self.centralWidget)
+        self.toolbarSelector.setEnabled(True)
+        self.toolbarSelector.setProperty("currentIndex", 0)
+        self.toolbarSelector.setProperty("drawBase", False)
+        self.toolbarSelector.setProperty("expanding", False)
+        self.toolbarSelector.setObjectName("toolbarSelector")
+        self.centralLayout.addWidget(self.toolbarSelector)
+        self.toolbarStack = QtWidgets.QStackedWidget(parent=self.centralWidget)
+        self.toolbarStack.setMinimumSize(QtCore.QSize(0, 48))
+        self.toolbarStack.setMaximumSize(QtCore.QSize(16777215, 48))
+        self.toolbarStack.setObjectName("toolbarStack")
+        self.designToolbarPage = QtWidgets.QWidget()
+        self.designToolbarPage.setObjectName("designToolbarPage")
+        self.designToolbarLayout = QtWidgets.QHBoxLayout(self.designToolbarPage)
+        self.designToolbarLayout.setContentsMargins(4, 2, 4, 2)
+        self.designToolbarLayout.setObjectName("designToolbarLayout")
+        self.toolSelect = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolSelect.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolSelect.setCheckable(True)
+        self.toolSelect.setChecked(True)
+        self.toolSelect.setObjectName("toolSelect")
+        self.designToolbarLayout.addWidget(self.toolSelect)
+        self.sep1 = QtWidgets.QFrame(parent=self.designToolbarPage)
+        self.sep1.setFrameShape(QtWidgets.QFrame.Shape.VLine)
+        self.sep1.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.sep1.setObjectName("sep1")
+        self.designToolbarLayout.addWidget(self.sep1)
+        self.toolMathTex = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolMathTex.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolMathTex.setCheckable(True)
+        self.toolMathTex.setObjectName("toolMathTex")
+        self.designToolbarLayout.addWidget(self.toolMathTex)
+        self.toolText = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolText.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolText.setCheckable(True)
+        self.toolText.setObjectName("toolText")
+        self.designToolbarLayout.addWidget(self.toolText)
+        self.sep2 = QtWidgets.QFrame(parent=self.designToolbarPage)
+        self.sep2.setFrameShape(QtWidgets.QFrame.Shape.VLine)
+        self.sep2.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.sep2.setObjectName("sep2")
+        self.designToolbarLayout.addWidget(self.sep2)
+        self.toolCircle = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolCircle.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolCircle.setCheckable(True)
+        self.toolCircle.setObjectName("toolCircle")
+        self.designToolbarLayout.addWidget(self.toolCircle)
+        self.toolRectangle = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolRectangle.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolRectangle.setCheckable(True)
+        self.toolRectangle.setObjectName("toolRectangle")
+        self.designToolbarLayout.addWidget(self.toolRectangle)
+        self.toolArrow = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolArrow.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolArrow.setCheckable(True)
+        self.toolArrow.setObjectName("toolArrow")
+        self.designToolbarLayout.addWidget(self.toolArrow)
+        self.toolLine = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolLine.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolLine.setCheckable(True)
+        self.toolLine.setObjectName("toolLine")
+        self.designToolbarLayout.addWidget(self.toolLine)
+        self.sep3 = QtWidgets.QFrame(parent=self.designToolbarPage)
+        self.sep3.setFrameShape(QtWidgets.QFrame.Shape.VLine)
+        self.sep3.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.sep3.setObjectName("sep3")
+        self.designToolbarLayout.addWidget(self.sep3)
+        self.toolColorPicker = QtWidgets.QToolButton(parent=self.designToolbarPage)
+        self.toolColorPicker.setMinimumSize(QtCore.QSize(60, 36))
+        self.toolColorPicker.setObjectName("toolColorPicker")
+        self.designToolbarLayout.addWidget(self.toolColorPicker)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.designToolbarLayout.addItem(spacerItem)
+        self.toolbarStack.addWidget(self.designToolbarPage)
+        self.animationToolbarPage = QtWidgets.QWidget()
+        self.animationToolbarPage.setObjectName("animationToolbarPage")
+        self.animationToolbarLayout = QtWidgets.QHBoxLayout(self.animationToolbarPage)
+        self.animationToolbarLayout.setContentsMargins(4, 2, 4, 2)
+        self.animationToolbarLayout.setObjectName("animationToolbarLayout")
+        self.btnAddAnimation = QtWidgets.QToolButton(parent=self.animationToolbarPage)
+        self.btnAddAnimation.setMinimumSize(QtCore.QSize(90, 36))
+        self.btnAddAnimation.setObjectName("btnAddAnimation")
+        self.animationToolbarLayout.addWidget(self.btnAddAnimation)
+        self.animSep1 = QtWidgets.QFrame(parent=self.animationToolbarPage)
+        self.animSep1.setFrameShape(QtWidgets.QFrame.Shape.VLine)
+        self.animSep1.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.animSep1.setObjectName("animSep1")
+        self.animationToolbarLayout.addWidget(self.animSep1)
+        self.labelAnimType = QtWidgets.QLabel(parent=self.animationToolbarPage)
+        self.labelAnimType.setObjectName("labelAnimType")
+        self.animationToolbarLayout.addWidget(self.labelAnimType)
+        self.comboAnimationType = QtWidgets.QComboBox(parent=self.animationToolbarPage)
+        self.comboAnimationType.setMinimumSize(QtCore.QSize(120, 30))
+        self.comboAnimationType.setObjectName("comboAnimationType")
+        self.comboAnimationType.addItem("")
+        self.comboAnimationType.addItem("")
+        self.comboAnimationType.addItem("")
+        self.comboAnimationType.addItem("")
+        self.comboAnimationType.addItem("")
+        self.comboAnimationType.addItem("")
+        self.comboAnimationType.addItem("")
+        self.animationToolbarLayout.addWidget(self.comboAnimationType)
+        self.animSep2 = QtWidgets.QFrame(parent=self.animationToolbarPage)
+        self.animSep2.setFrameShape(QtWidgets.QFrame.Shape.VLine)
+        self.animSep2.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.animSep2.setObjectName("animSep2")
+        self.animationToolbarLayout.addWidget(self.animSep2)
+        self.labelDuration = QtWidgets.QLabel(parent=self.animationToolbarPage)
+        self.labelDuration.setObjectName("labelDuration")
+        self.animationToolbarLayout.addWidget(self.labelDuration)
+        self.spinDuration = QtWidgets.QDoubleSpinBox(parent=self.animationToolbarPage)
+        self.spinDuration.setMinimumSize(QtCore.QSize(80, 30))
+        self.spinDuration.setMinimum(0.1)
+        self.spinDuration.setMaximum(30.0)
+        self.spinDuration.setSingleStep(0.1)
+        self.spinDuration.setProperty("value", 1.0)
+        self.spinDuration.setObjectName("spinDuration")
+        self.animationToolbarLayout.addWidget(self.spinDuration)
+        self.animSep3 = QtWidgets.QFrame(parent=self.animationToolbarPage)
+        self.animSep3.setFrameShape(QtWidgets.QFrame.Shape.VLine)
+        self.animSep3.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.animSep3.setObjectName("animSep3")
+        self.animationToolbarLayout.addWidget(self.animSep3)
+        self.btnPreviewScene = QtWidgets.QToolButton(parent=self.animationToolbarPage)
+        self.btnPreviewScene.setMinimumSize(QtCore.QSize(70, 36))
+        self.btnPreviewScene.setObjectName("btnPreviewScene")
+        self.animationToolbarLayout.addWidget(self.btnPreviewScene)
+        self.btnRenderScene = QtWidgets.QToolButton(parent=self.animationToolbarPage)
+        self.btnRenderScene.setMinimumSize(QtCore.QSize(90, 36))
+        self.btnRenderScene.setObjectName("btnRenderScene")
+        self.animationToolbarLayout.addWidget(self.btnRenderScene)
+        self.btnRenderAll = QtWidgets.QToolButton(parent=self.animationToolbarPage)
+        self.btnRenderAll.setMinimumSize(QtCore.QSize(80, 36))
+        self.btnRenderAll.setObjectName("btnRenderAll")
+        self.animationToolbarLayout.addWidget(self.btnRenderAll)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.animationToolbarLayout.addItem(spacerItem1)
+        self.btnDockPreview = QtWidgets.QToolButton(parent=self.animationToolbarPage)
+        self.btnDockPreview.setMinimumSize(QtCore.QSize(60, 36))
+        self.btnDockPreview.setCheckable(True)
+        self.btnDockPreview.setObjectName("btnDockPreview")
+        self.animationToolbarLayout.addWidget(self.btnDockPreview)
+        self.toolbarStack.addWidget(self.animationToolbarPage)
+        self.centralLayout.addWidget(self.toolbarStack)
+        self.toolbarSeparator = QtWidgets.QFrame(parent=self.centralWidget)
+        self.toolbarSeparator.setFrameShape(QtWidgets.QFrame.Shape.HLine)
+        self.toolbarSeparator.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.toolbarSeparator.setObjectName("toolbarSeparator")
+        self.centralLayout.addWidget(self.toolbarSeparator)
+        self.mainSplitter = QtWidgets.QSplitter(parent=self.centralWidget)
+        self.mainSplitter.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.mainSplitter.setObjectName("mainSplitter")
+        self.leftPanelSplitter = QtWidgets.QSplitter(parent=self.mainSplitter)
+        self.leftPanelSplitter.setMinimumSize(QtCore.QSize(200, 0))
+        self.leftPanelSplitter.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.leftPanelSplitter.setOrientation(QtCore.Qt.Orientation.Vertical)
+        self.leftPanelSplitter.setObjectName("leftPanelSplitter")
+        self.scenesGroup = QtWidgets.QGroupBox(parent=self.leftPanelSplitter)
+        self.scenesGroup.setObjectName("scenesGroup")
+        self.scenesLayout = QtWidgets.QVBoxLayout(self.scenesGroup)
+        self.scenesLayout.setContentsMargins(4, 4, 4, 4)
+        self.scenesLayout.setSpacing(4)
+        self.scenesLayout.setObjectName("scenesLayout")
+        self.scenesList = QtWidgets.QListWidget(parent=self.scenesGroup)
+        self.scenesList.setIconSize(QtCore.QSize(160, 90))
+        self.scenesList.setObjectName("scenesList")
+        self.scenesLayout.addWidget(self.scenesList)
+        self.scenesButtonLayout = QtWidgets.QHBoxLayout()
+        self.scenesButtonLayout.setObjectName("scenesButtonLayout")
+        self.btnAddScene = QtWidgets.QPushButton(parent=self.scenesGroup)
+        self.btnAddScene.setMaximumSize(QtCore.QSize(80, 28))
+        self.btnAddScene.setObjectName("btnAddScene")
+        self.scenesButtonLayout.addWidget(self.btnAddScene)
+        self.btnDeleteScene = QtWidgets.QPushButton(parent=self.scenesGroup)
+        self.btnDeleteScene.setMaximumSize(QtCore.QSize(60, 28))
+        self.btnDeleteScene.setObjectName("btnDeleteScene")
+        self.scenesButtonLayout.addWidget(self.btnDeleteScene)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.scenesButtonLayout.addItem(spacerItem2)
+        self.scenesLayout.addLayout(self.scenesButtonLayout)
+        self.animationsGroup = QtWidgets.QGroupBox(parent=self.leftPanelSplitter)
+        self.animationsGroup.setObjectName("animationsGroup")
+        self.animationsLayout = QtWidgets.QVBoxLayout(self.animationsGroup)
+        self.animationsLayout.setContentsMargins(4, 4, 4, 4)
+        self.animationsLayout.setSpacing(4)
+        self.animationsLayout.setObjectName("animationsLayout")
+        self.animationsList = QtWidgets.QListWidget(parent=self.animationsGroup)
+        self.animationsList.setObjectName("animationsList")
+        self.animationsLayout.addWidget(self.animationsList)
+        self.animButtonLayout = QtWidgets.QHBoxLayout()
+        self.animButtonLayout.setObjectName("animButtonLayout")
+        self.btnDeleteAnim = QtWidgets.QPushButton(parent=self.animationsGroup)
+        self.btnDeleteAnim.setMaximumSize(QtCore.QSize(60, 28))
+        self.btnDeleteAnim.setObjectName("btnDeleteAnim")
+        self.animButtonLayout.addWidget(self.btnDeleteAnim)
+        self.btnMoveAnimUp = QtWidgets.QPushButton(parent=self.animationsGroup)
+        self.btnMoveAnimUp.setMaximumSize(QtCore.QSize(40, 28))
+        self.btnMoveAnimUp.setObjectName("btnMoveAnimUp")
+        self.animButtonLayout.addWidget(self.btnMoveAnimUp)
+        self.btnMoveAnimDown = QtWidgets.QPushButton(parent=self.animationsGroup)
+        self.btnMoveAnimDown.setMaximumSize(QtCore.QSize(50, 28))
+        self.btnMoveAnimDown.setObjectName("btnMoveAnimDown")
+        self.animButtonLayout.addWidget(self.btnMoveAnimDown)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.animButtonLayout.addItem(spacerItem3)
+        self.animationsLayout.addLayout(self.animButtonLayout)
+        self.centerPanel = QtWidgets.QWidget(parent=self.mainSplitter)
+        self.centerPanel.setObjectName("centerPanel")
+        self.centerLayout = QtWidgets.QVBoxLayout(self.centerPanel)
+        self.centerLayout.setContentsMargins(0, 0, 0, 0)
+        self.centerLayout.setSpacing(0)
+        self.centerLayout.setObjectName("centerLayout")
+        self.centerTabBar = QTabBar(parent=self.centerPanel)
+        self.centerTabBar.setProperty("drawBase", False)
+        self.centerTabBar.setProperty("expanding", False)
+        self.centerTabBar.setObjectName("centerTabBar")
+        self.centerLayout.addWidget(self.centerTabBar)
+        self.centerStack = QtWidgets.QStackedWidget(parent=self.centerPanel)
+        self.centerStack.setObjectName("centerStack")
+        self.canvasPage = QtWidgets.QWidget()
+        self.canvasPage.setObjectName("canvasPage")
+        self.canvasPageLayout = QtWidgets.QVBoxLayout(self.canvasPage)
+        self.canvasPageLayout.setContentsMargins(0, 0, 0, 0)
+        self.canvasPageLayout.setObjectName("canvasPageLayout")
+        self.canvasView = QtWidgets.QGraphicsView(parent=self.canvasPage)
+        self.canvasView.setObjectName("canvasView")
+        self.canvasPageLayout.addWidget(self.canvasView)
+        self.centerStack.addWidget(self.canvasPage)
+        self.codePage = QtWidgets.QWidget()
+        self.codePage.setObjectName("codePage")
+        self.codePageLayout = QtWidgets.QVBoxLayout(self.codePage)
+        self.codePageLayout.setContentsMargins(0, 0, 0, 0)
+        self.codePageLayout.setObjectName("codePageLayout")
+        self.codeEditor = QtWidgets.QPlainTextEdit(parent=self.codePage)
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        font.setPointSize(11)
+        self.codeEditor.setFont(font)
+        self.codeEditor.setReadOnly(False)
+        self.codeEditor.setObjectName("codeEditor")
+        self.codePageLayout.addWidget(self.codeEditor)
+        self.centerStack.addWidget(self.codePage)
+        self.codeCEPage = QtWidgets.QWidget()
+        self.codeCEPage.setObjectName("codeCEPage")
+        self.codeCEPageLayout = QtWidgets.QVBoxLayout(self.codeCEPage)
+        self.codeCEPageLayout.setContentsMargins(0, 0, 0, 0)
+        self.codeCEPageLayout.setObjectName("codeCEPageLayout")
+        self.codeEditorCE = QtWidgets.QPlainTextEdit(parent=self.codeCEPage)
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        font.setPointSize(11)
+        self.codeEditorCE.setFont(font)
+        self.codeEditorCE.setReadOnly(False)
+        self.codeEditorCE.setObjectName("codeEditorCE")
+        self.codeCEPageLayout.addWidget(self.codeEditorCE)
+        self.centerStack.addWidget(self.codeCEPage)
+        self.consolePage = QtWidgets.QWidget()
+        self.consolePage.setObjectName("consolePage")
+        self.consolePageLayout = QtWidgets.QVBoxLayout(self.consolePage)
+        self.consolePageLayout.setContentsMargins(0, 0, 0, 0)
+        self.consolePageLayout.setObjectName("consolePageLayout")
+        self.consolePane = QtWidgets.QPlainTextEdit(parent=self.consolePage)
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        font.setPointSize(10)
+        self.consolePane.setFont(font)
+        self.consolePane.setReadOnly(True)
+        self.consolePane.setObjectName("consolePane")
+        self.consolePageLayout.addWidget(self.consolePane)
+        self.centerStack.addWidget(self.consolePage)
+        self.centerLayout.addWidget(self.centerStack)
+        self.rightPanel = QtWidgets.QWidget(parent=self.mainSplitter)
+        self.rightPanel.setMinimumSize(QtCore.QSize(220, 0))
+        self.rightPanel.setMaximumSize(QtCore.QSize(350, 16777215))
+        self.rightPanel.setObjectName("rightPanel")
+        self.rightPanelLayout = QtWidgets.QVBoxLayout(self.rightPanel)
+        self.rightPanelLayout.setContentsMargins(0, 0, 0, 0)
+        self.rightPanelLayout.setSpacing(4)
+        self.rightPanelLayout.setObjectName("rightPanelLayout")
+        self.propertiesGroup = QtWidgets.QGroupBox(parent=self.rightPanel)
+        self.propertiesGroup.setObjectName("propertiesGroup")
+        self.propertiesLayout = QtWidgets.QVBoxLayout(self.propertiesGroup)
+        self.propertiesLayout.setContentsMargins(4, 4, 4, 4)
+        self.propertiesLayout.setSpacing(4)
+        self.propertiesLayout.setObjectName("propertiesLayout")
+        self.propertiesStack = QtWidgets.QStackedWidget(parent=self.propertiesGroup)
+        self.propertiesStack.setObjectName("propertiesStack")
+        self.propsEmptyPage = QtWidgets.QWidget()
+        self.propsEmptyPage.setObjectName("propsEmptyPage")
+        self.propsEmptyLayout = QtWidgets.QVBoxLayout(self.propsEmptyPage)
+        self.propsEmptyLayout.setObjectName("propsEmptyLayout")
+        self.labelNoSelection = QtWidgets.QLabel(parent=self.propsEmptyPage)
+        self.labelNoSelection.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.labelNoSelection.setWordWrap(True)
+        self.labelNoSelection.setObjectName("labelNoSelection")
+        self.propsEmptyLayout.addWidget(self.labelNoSelection)
+        self.propertiesStack.addWidget(self.propsEmptyPage)
+        self.propsTextPage = QtWidgets.QWidget()
+        self.propsTextPage.setObjectName("propsTextPage")
+        self.propsTextFormLayout = QtWidgets.QFormLayout(self.propsTextPage)
+        self.propsTextFormLayout.setObjectName("propsTextFormLayout")
+        self.labelObjName = QtWidgets.QLabel(parent=self.propsTextPage)
+        self.labelObjName.setObjectName("labelObjName")
+        self.propsTextFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelObjName)
+        self.editObjName = QtWidgets.QLineEdit(parent=self.propsTextPage)
+        self.editObjName.setObjectName("editObjName")
+        self.propsTextFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.editObjName)
+        self.labelLatex = QtWidgets.QLabel(parent=self.propsTextPage)
+        self.labelLatex.setObjectName("labelLatex")
+        self.propsTextFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelLatex)
+        self.editLatexCode = QtWidgets.QPlainTextEdit(parent=self.propsTextPage)
+        self.editLatexCode.setMaximumSize(QtCore.QSize(16777215, 120))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        font.setPointSize(10)
+        self.editLatexCode.setFont(font)
+        self.editLatexCode.setObjectName("editLatexCode")
+        self.propsTextFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.editLatexCode)
+        self.labelTextColor = QtWidgets.QLabel(parent=self.propsTextPage)
+        self.labelTextColor.setObjectName("labelTextColor")
+        self.propsTextFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelTextColor)
+        self.btnTextColor = QtWidgets.QPushButton(parent=self.propsTextPage)
+        self.btnTextColor.setObjectName("btnTextColor")
+        self.propsTextFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.btnTextColor)
+        self.labelFontSize = QtWidgets.QLabel(parent=self.propsTextPage)
+        self.labelFontSize.setObjectName("labelFontSize")
+        self.propsTextFormLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelFontSize)
+        self.spinFontSize = QtWidgets.QSpinBox(parent=self.propsTextPage)
+        self.spinFontSize.setMinimum(8)
+        self.spinFontSize.setMaximum(200)
+        self.spinFontSize.setProperty("value", 48)
+        self.spinFontSize.setObjectName("spinFontSize")
+        self.propsTextFormLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinFontSize)
+        self.labelPosX = QtWidgets.QLabel(parent=self.propsTextPage)
+        self.labelPosX.setObjectName("labelPosX")
+        self.propsTextFormLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelPosX)
+        self.spinPosX = QtWidgets.QDoubleSpinBox(parent=self.propsTextPage)
+        self.spinPosX.setDecimals(2)
+        self.spinPosX.setMinimum(-8.0)
+        self.spinPosX.setMaximum(8.0)
+        self.spinPosX.setSingleStep(0.1)
+        self.spinPosX.setObjectName("spinPosX")
+        self.propsTextFormLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinPosX)
+        self.labelPosY = QtWidgets.QLabel(parent=self.propsTextPage)
+        self.labelPosY.setObjectName("labelPosY")
+        self.propsTextFormLayout.setWidget(5, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelPosY)
+        self.spinPosY = QtWidgets.QDoubleSpinBox(parent=self.propsTextPage)
+        self.spinPosY.setDecimals(2)
+        self.spinPosY.setMinimum(-5.0)
+        self.spinPosY.setMaximum(5.0)
+        self.spinPosY.setSingleStep(0.1)
+        self.spinPosY.setObjectName("spinPosY")
+        self.propsTextFormLayout.setWidget(5, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinPosY)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.propsTextFormLayout.setItem(6, QtWidgets.QFormLayout.ItemRole.LabelRole, spacerItem4)
+        self.propertiesStack.addWidget(self.propsTextPage)
+        self.propsShapePage = QtWidgets.QWidget()
+        self.propsShapePage.setObjectName("propsShapePage")
+        self.propsShapeFormLayout = QtWidgets.QFormLayout(self.propsShapePage)
+        self.propsShapeFormLayout.setObjectName("propsShapeFormLayout")
+        self.labelShapeName = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelShapeName.setObjectName("labelShapeName")
+        self.propsShapeFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelShapeName)
+        self.editShapeName = QtWidgets.QLineEdit(parent=self.propsShapePage)
+        self.editShapeName.setObjectName("editShapeName")
+        self.propsShapeFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.editShapeName)
+        self.labelShapeType = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelShapeType.setObjectName("labelShapeType")
+        self.propsShapeFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelShapeType)
+        self.labelShapeTypeValue = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelShapeTypeValue.setObjectName("labelShapeTypeValue")
+        self.propsShapeFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.labelShapeTypeValue)
+        self.labelStrokeColor = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelStrokeColor.setObjectName("labelStrokeColor")
+        self.propsShapeFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelStrokeColor)
+        self.btnStrokeColor = QtWidgets.QPushButton(parent=self.propsShapePage)
+        self.btnStrokeColor.setObjectName("btnStrokeColor")
+        self.propsShapeFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.btnStrokeColor)
+        self.labelFillColor = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelFillColor.setObjectName("labelFillColor")
+        self.propsShapeFormLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelFillColor)
+        self.btnFillColor = QtWidgets.QPushButton(parent=self.propsShapePage)
+        self.btnFillColor.setObjectName("btnFillColor")
+        self.propsShapeFormLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.btnFillColor)
+        self.labelStrokeWidth = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelStrokeWidth.setObjectName("labelStrokeWidth")
+        self.propsShapeFormLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelStrokeWidth)
+        self.spinStrokeWidth = QtWidgets.QDoubleSpinBox(parent=self.propsShapePage)
+        self.spinStrokeWidth.setMinimum(0.5)
+        self.spinStrokeWidth.setMaximum(20.0)
+        self.spinStrokeWidth.setSingleStep(0.5)
+        self.spinStrokeWidth.setProperty("value", 2.0)
+        self.spinStrokeWidth.setObjectName("spinStrokeWidth")
+        self.propsShapeFormLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinStrokeWidth)
+        self.labelRadius = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelRadius.setObjectName("labelRadius")
+        self.propsShapeFormLayout.setWidget(5, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelRadius)
+        self.spinRadius = QtWidgets.QDoubleSpinBox(parent=self.propsShapePage)
+        self.spinRadius.setMinimum(0.1)
+        self.spinRadius.setMaximum(10.0)
+        self.spinRadius.setSingleStep(0.1)
+        self.spinRadius.setProperty("value", 1.0)
+        self.spinRadius.setObjectName("spinRadius")
+        self.propsShapeFormLayout.setWidget(5, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinRadius)
+        self.labelShapePosX = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelShapePosX.setObjectName("labelShapePosX")
+        self.propsShapeFormLayout.setWidget(6, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelShapePosX)
+        self.spinShapePosX = QtWidgets.QDoubleSpinBox(parent=self.propsShapePage)
+        self.spinShapePosX.setDecimals(2)
+        self.spinShapePosX.setMinimum(-8.0)
+        self.spinShapePosX.setMaximum(8.0)
+        self.spinShapePosX.setSingleStep(0.1)
+        self.spinShapePosX.setObjectName("spinShapePosX")
+        self.propsShapeFormLayout.setWidget(6, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinShapePosX)
+        self.labelShapePosY = QtWidgets.QLabel(parent=self.propsShapePage)
+        self.labelShapePosY.setObjectName("labelShapePosY")
+        self.propsShapeFormLayout.setWidget(7, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelShapePosY)
+        self.spinShapePosY = QtWidgets.QDoubleSpinBox(parent=self.propsShapePage)
+        self.spinShapePosY.setDecimals(2)
+        self.spinShapePosY.setMinimum(-5.0)
+        self.spinShapePosY.setMaximum(5.0)
+        self.spinShapePosY.setSingleStep(0.1)
+        self.spinShapePosY.setObjectName("spinShapePosY")
+        self.propsShapeFormLayout.setWidget(7, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinShapePosY)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.propsShapeFormLayout.setItem(8, QtWidgets.QFormLayout.ItemRole.FieldRole, spacerItem5)
+        self.propertiesStack.addWidget(self.propsShapePage)
+        self.propsAnimPage = QtWidgets.QWidget()
+        self.propsAnimPage.setObjectName("propsAnimPage")
+        self.propsAnimFormLayout = QtWidgets.QFormLayout(self.propsAnimPage)
+        self.propsAnimFormLayout.setObjectName("propsAnimFormLayout")
+        self.labelAnimTarget = QtWidgets.QLabel(parent=self.propsAnimPage)
+        self.labelAnimTarget.setObjectName("labelAnimTarget")
+        self.propsAnimFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelAnimTarget)
+        self.comboAnimTarget = QtWidgets.QComboBox(parent=self.propsAnimPage)
+        self.comboAnimTarget.setObjectName("comboAnimTarget")
+        self.propsAnimFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboAnimTarget)
+        self.labelPropAnimType = QtWidgets.QLabel(parent=self.propsAnimPage)
+        self.labelPropAnimType.setObjectName("labelPropAnimType")
+        self.propsAnimFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelPropAnimType)
+        self.comboAnimTypeProps = QtWidgets.QComboBox(parent=self.propsAnimPage)
+        self.comboAnimTypeProps.setObjectName("comboAnimTypeProps")
+        self.comboAnimTypeProps.addItem("")
+        self.comboAnimTypeProps.addItem("")
+        self.comboAnimTypeProps.addItem("")
+        self.comboAnimTypeProps.addItem("")
+        self.comboAnimTypeProps.addItem("")
+        self.comboAnimTypeProps.addItem("")
+        self.comboAnimTypeProps.addItem("")
+        self.propsAnimFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboAnimTypeProps)
+        self.labelPropDuration = QtWidgets.QLabel(parent=self.propsAnimPage)
+        self.labelPropDuration.setObjectName("labelPropDuration")
+        self.propsAnimFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelPropDuration)
+        self.spinAnimDuration = QtWidgets.QDoubleSpinBox(parent=self.propsAnimPage)
+        self.spinAnimDuration.setMinimum(0.1)
+        self.spinAnimDuration.setMaximum(30.0)
+        self.spinAnimDuration.setSingleStep(0.1)
+        self.spinAnimDuration.setProperty("value", 1.0)
+        self.spinAnimDuration.setObjectName("spinAnimDuration")
+        self.propsAnimFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinAnimDuration)
+        self.labelEasing = QtWidgets.QLabel(parent=self.propsAnimPage)
+        self.labelEasing.setObjectName("labelEasing")
+        self.propsAnimFormLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelEasing)
+        self.comboEasing = QtWidgets.QComboBox(parent=self.propsAnimPage)
+        self.comboEasing.setObjectName("comboEasing")
+        self.comboEasing.addItem("")
+        self.comboEasing.addItem("")
+        self.comboEasing.addItem("")
+        self.comboEasing.addItem("")
+        self.comboEasing.addItem("")
+        self.propsAnimFormLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboEasing)
+        spacerItem6 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.propsAnimFormLayout.setItem(4, QtWidgets.QFormLayout.ItemRole.LabelRole, spacerItem6)
+        self.propertiesStack.addWidget(self.propsAnimPage)
+        self.propsScenePage = QtWidgets.QWidget()
+        self.propsScenePage.setObjectName("propsScenePage")
+        self.propsSceneFormLayout = QtWidgets.QFormLayout(self.propsScenePage)
+        self.propsSceneFormLayout.setObjectName("propsSceneFormLayout")
+        self.labelSceneName = QtWidgets.QLabel(parent=self.propsScenePage)
+        self.labelSceneName.setObjectName("labelSceneName")
+        self.propsSceneFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelSceneName)
+        self.editSceneName = QtWidgets.QLineEdit(parent=self.propsScenePage)
+        self.editSceneName.setObjectName("editSceneName")
+        self.propsSceneFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.editSceneName)
+        self.labelSceneBgColor = QtWidgets.QLabel(parent=self.propsScenePage)
+        self.labelSceneBgColor.setObjectName("labelSceneBgColor")
+        self.propsSceneFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelSceneBgColor)
+        self.btnSceneBgColor = QtWidgets.QPushButton(parent=self.propsScenePage)
+        self.btnSceneBgColor.setObjectName("btnSceneBgColor")
+        self.propsSceneFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.btnSceneBgColor)
+        spacerItem7 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.propsSceneFormLayout.setItem(2, QtWidgets.QFormLayout.ItemRole.LabelRole, spacerItem7)
+        self.propertiesStack.addWidget(self.propsScenePage)
+        self.propertiesLayout.addWidget(self.propertiesStack)
+        self.rightPanelLayout.addWidget(self.propertiesGroup)
+        self.renderGroup = QtWidgets.QGroupBox(parent=self.rightPanel)
+        self.renderGroup.setObjectName("renderGroup")
+        self.renderFormLayout = QtWidgets.QFormLayout(self.renderGroup)
+        self.renderFormLayout.setContentsMargins(4, 4, 4, 4)
+        self.renderFormLayout.setObjectName("renderFormLayout")
+        self.labelRenderQuality = QtWidgets.QLabel(parent=self.renderGroup)
+        self.labelRenderQuality.setObjectName("labelRenderQuality")
+        self.renderFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelRenderQuality)
+        self.comboRenderQuality = QtWidgets.QComboBox(parent=self.renderGroup)
+        self.comboRenderQuality.setObjectName("comboRenderQuality")
+        self.comboRenderQuality.addItem("")
+        self.comboRenderQuality.addItem("")
+        self.comboRenderQuality.addItem("")
+        self.comboRenderQuality.addItem("")
+        self.renderFormLayout.setWidget(0, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboRenderQuality)
+        self.labelRenderFps = QtWidgets.QLabel(parent=self.renderGroup)
+        self.labelRenderFps.setObjectName("labelRenderFps")
+        self.renderFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelRenderFps)
+        self.spinRenderFps = QtWidgets.QSpinBox(parent=self.renderGroup)
+        self.spinRenderFps.setMinimum(1)
+        self.spinRenderFps.setMaximum(120)
+        self.spinRenderFps.setProperty("value", 60)
+        self.spinRenderFps.setObjectName("spinRenderFps")
+        self.renderFormLayout.setWidget(1, QtWidgets.QFormLayout.ItemRole.FieldRole, self.spinRenderFps)
+        self.labelRenderFormat = QtWidgets.QLabel(parent=self.renderGroup)
+        self.labelRenderFormat.setObjectName("labelRenderFormat")
+        self.renderFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelRenderFormat)
+        self.comboRenderFormat = QtWidgets.QComboBox(parent=self.renderGroup)
+        self.comboRenderFormat.setObjectName("comboRenderFormat")
+        self.comboRenderFormat.addItem("")
+        self.comboRenderFormat.addItem("")
+        self.comboRenderFormat.addItem("")
+        self.renderFormLayout.setWidget(2, QtWidgets.QFormLayout.ItemRole.FieldRole, self.comboRenderFormat)
+        self.labelOutputDir = QtWidgets.QLabel(parent=self.renderGroup)
+        self.labelOutputDir.setObjectName("labelOutputDir")
+        self.renderFormLayout.setWidget(3, QtWidgets.QFormLayout.ItemRole.LabelRole, self.labelOutputDir)
+        self.outputDirLayout = QtWidgets.QHBoxLayout()
+        self.outputDirLayout.setSpacing(2)
+        self.outputDirLayout.setObjectName("outputDirLayout")
+        self.editOutputDir = QtWidgets.QLineEdit(parent=self.renderGroup)
+        self.editOutputDir.setObjectName("editOutputDir")
+        self.outputDirLayout.addWidget(self.editOutputDir)
+        self.btnBrowseOutput = QtWidgets.QPushButton(parent=self.renderGroup)
+        self.btnBrowseOutput.setMaximumSize(QtCore.QSize(30, 16777215))
+        self.btnBrowseOutput.setObjectName("btnBrowseOutput")
+        self.outputDirLayout.addWidget(self.btnBrowseOutput)
+        self.renderFormLayout.setLayout(3, QtWidgets.QFormLayout.ItemRole.FieldRole, self.outputDirLayout)
+        self.checkOpenOnComplete = QtWidgets.QCheckBox(parent=self.renderGroup)
+        self.checkOpenOnComplete.setChecked(True)
+        self.checkOpenOnComplete.setObjectName("checkOpenOnComplete")
+        self.renderFormLayout.setWidget(4, QtWidgets.QFormLayout.ItemRole.FieldRole, self.checkOpenOnComplete)
+        self.rightPanelLayout.addWidget(self.renderGroup)
+        self.centralLayout.addWidget(self.mainSplitter)
+        MainWindow.setCentralWidget(self.centralWidget)
+        self.menuBar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menuBar.setGeometry(QtCore.QRect(0, 0, 2046, 21))
+        self.menuBar.setObjectName("menuBar")
+        self.menuFile = QtWidgets.QMenu(parent=self.menuBar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuEdit = QtWidgets.QMenu(parent=self.menuBar)
+        self.menuEdit.setObjectName("menuEdit")
+        self.menuView = QtWidgets.QMenu(parent=self.menuBar)
+        self.menuView.setObjectName("menuView")
+        self.menuHelp = QtWidgets.QMenu(parent=self.menuBar)
+        self.menuHelp.setObjectName("menuHelp")
+        MainWindow.setMenuBar(self.menuBar)
+        self.statusBar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusBar.setObjectName("statusBar")
+        MainWindow.setStatusBar(self.statusBar)
+        self.actionNew = QtGui.QAction(parent=MainWindow)
+        self.actionNew.setObjectName("actionNew")
+        self.actionOpen = QtGui.QAction(parent=MainWindow)
+        self.actionOpen.setObjectName("actionOpen")
+        self.actionSave = QtGui.QAction(parent=MainWindow)
+        self.actionSave.setObjectName("actionSave")
+        self.actionSaveAs = QtGui.QAction(parent=MainWindow)
+        self.actionSaveAs.setObjectName("actionSaveAs")
+        self.actionExportPy = QtGui.QAction(parent=MainWindow)
+        self.actionExportPy.setObjectName("actionExportPy")
+        self.actionRenderVideo = QtGui.QAction(parent=MainWindow)
+        self.actionRenderVideo.setObjectName("actionRenderVideo")
+        self.actionExit = QtGui.QAction(parent=MainWindow)
+        self.actionExit.setObjectName("actionExit")
+        self.actionCopy = QtGui.QAction(parent=MainWindow)
+        self.actionCopy.setObjectName("actionCopy")
+        self.actionPaste = QtGui.QAction(parent=MainWindow)
+        self.actionPaste.setObjectName("actionPaste")
+        self.actionUndo = QtGui.QAction(parent=MainWindow)
+        self.actionUndo.setObjectName("actionUndo")
+        self.actionRedo = QtGui.QAction(parent=MainWindow)
+        self.actionRedo.setObjectName("actionRedo")
+        self.actionDelete = QtGui.QAction(parent=MainWindow)
+        self.actionDelete.setObjectName("actionDelete")
+        self.actionSelectAll = QtGui.QAction(parent=MainWindow)
+        self.actionSelectAll.setObjectName("actionSelectAll")
+        self.actionToggleScenes = QtGui.QAction(parent=MainWindow)
+        self.actionToggleScenes.setCheckable(True)
+        self.actionToggleScenes.setChecked(True)
+        self.actionToggleScenes.setObjectName("actionToggleScenes")
+        self.actionToggleAnimations = QtGui.QAction(parent=MainWindow)
+        self.actionToggleAnimations.setCheckable(True)
+        self.actionToggleAnimations.setChecked(True)
+        self.actionToggleAnimations.setObjectName("actionToggleAnimations")
+        self.actionToggleProperties = QtGui.QAction(parent=MainWindow)
+        self.actionToggleProperties.setCheckable(True)
+        self.actionToggleProperties.setChecked(True)
+        self.actionToggleProperties.setObjectName("actionToggleProperties")
+        self.actionAbout = QtGui.QAction(parent=MainWindow)
+        self.actionAbout.setObjectName("actionAbout")
+        self.menuFile.addAction(self.actionNew)
+        self.menuFile.addAction(self.actionOpen)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionSave)
+        self.menuFile.addAction(self.actionSaveAs)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionExportPy)
+        self.menuFile.addAction(self.actionRenderVideo)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionExit)
+        self.menuEdit.addAction(self.actionUndo)
+        self.menuEdit.addAction(self.actionRedo)
+        self.menuEdit.addSeparator()
+        self.menuEdit.addAction(self.actionCopy)
+        self.menuEdit.addAction(self.actionPaste)
+        self.menuEdit.addSeparator()
+        self.menuEdit.addAction(self.actionDelete)
+        self.menuEdit.addAction(self.actionSelectAll)
+        self.menuView.addAction(self.actionToggleScenes)
+        self.menuView.addAction(self.actionToggleAnimations)
+        self.menuView.addAction(self.actionToggleProperties)
+        self.menuHelp.addAction(self.actionAbout)
+        self.menuBar.addAction(self.menuFile.menuAction())
+        self.menuBar.addAction(self.menuEdit.menuAction())
+        self.menuBar.addAction(self.menuView.menuAction())
+        self.menuBar.addAction(self.menuHelp.menuAction())
+
+        self.retranslateUi(MainWindow)
+        self.toolbarStack.setCurrentIndex(1)
+        self.propertiesStack.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Manim Composer"))
+        self.toolSelect.setToolTip(_translate("MainWindow", "Select and move objects"))
+        self.toolSelect.setText(_translate("MainWindow", "Select"))
+        self.toolMathTex.setToolTip(_translate("MainWindow", "Add LaTeX equation"))
+        self.toolMathTex.setText(_translate("MainWindow", "MathTex"))
+        self.toolText.setToolTip(_translate("MainWindow", "Add plain text"))
+        self.toolText.setText(_translate("MainWindow", "Text"))
+        self.toolCircle.setToolTip(_translate("MainWindow", "Add circle"))
+        self.toolCircle.setText(_translate("MainWindow", "Circle"))
+        self.toolRectangle.setToolTip(_translate("MainWindow", "Add rectangle"))
+        self.toolRectangle.setText(_translate("MainWindow", "Rect"))
+        self.toolArrow.setToolTip(_translate("MainWindow", "Add arrow"))
+        self.toolArrow.setText(_translate("MainWindow", "Arrow"))
+        self.toolLine.setToolTip(_translate("MainWindow", "Add line"))
+        self.toolLine.setText(_translate("MainWindow", "Line"))
+        self.toolColorPicker.setToolTip(_translate("MainWindow", "Pick color"))
+        self.toolColorPicker.setText(_translate("MainWindow", "Color"))
+        self.btnAddAnimation.setToolTip(_translate("MainWindow", "Add animation to selected object"))
+        self.btnAddAnimation.setText(_translate("MainWindow", "+ Animation"))
+        self.labelAnimType.setText(_translate("MainWindow", "Type:"))
+        self.comboAnimationType.setItemText(0, _translate("MainWindow", "Add"))
+        self.comboAnimationType.setItemText(1, _translate("MainWindow", "Wait"))
+        self.comboAnimationType.setItemText(2, _translate("MainWindow", "FadeIn"))
+        self.comboAnimationType.setItemText(3, _translate("MainWindow", "FadeOut"))
+        self.comboAnimationType.setItemText(4, _translate("MainWindow", "Write"))
+        self.comboAnimationType.setItemText(5, _translate("MainWindow", "ShowCreation"))
+        self.comboAnimationType.setItemText(6, _translate("MainWindow", "Transform"))
+        self.labelDuration.setText(_translate("MainWindow", "Duration:"))
+        self.spinDuration.setSuffix(_translate("MainWindow", "s"))
+        self.btnPreviewScene.setToolTip(_translate("MainWindow", "Preview scene in ManimGL (Ctrl+P)"))
+        self.btnPreviewScene.setText(_translate("MainWindow", "Preview"))
+        self.btnRenderScene.setToolTip(_translate("MainWindow", "Render current scene to video (Manim CE)"))
+        self.btnRenderScene.setText(_translate("MainWindow", "Render Scene"))
+        self.btnRenderAll.setToolTip(_translate("MainWindow", "Render all scenes to video (Manim CE)"))
+        self.btnRenderAll.setText(_translate("MainWindow", "Render All"))
+        self.btnDockPreview.setToolTip(_translate("MainWindow", "Dock preview window to the right of the Composer"))
+        self.btnDockPreview.setText(_translate("MainWindow", "Dock"))
+        self.scenesGroup.setTitle(_translate("MainWindow", "Scenes"))
+        self.btnAddScene.setText(_translate("MainWindow", "+ Scene"))
+        self.btnDeleteScene.setText(_translate("MainWindow", "Delete"))
+        self.animationsGroup.setTitle(_translate("MainWindow", "Animations"))
+        self.btnDeleteAnim.setText(_translate("MainWindow", "Delete"))
+        self.btnMoveAnimUp.setText(_translate("MainWindow", "Up"))
+        self.btnMoveAnimDown.setText(_translate("MainWindow", "Down"))
+        self.canvasView.setStyleSheet(_translate("MainWindow", "background-color: #000000;"))
+        self.codeEditor.setStyleSheet(_translate("MainWindow", "QPlainTextEdit { background-color: #272822; color: #F8F8F2; }"))
+        self.codeEditor.setPlaceholderText(_translate("MainWindow", "# ManimGL code will appear here..."))
+        self.codeEditorCE.setStyleSheet(_translate("MainWindow", "QPlainTextEdit { background-color: #272822; color: #F8F8F2; }"))
+        self.codeEditorCE.setPlaceholderText(_translate("MainWindow", "# Manim Community code will appear here..."))
+        self.consolePane.setStyleSheet(_translate("MainWindow", "QPlainTextEdit { background-color: #272822; color: #F8F8F2; }"))
+        self.consolePane.setPlaceholderText(_translate("MainWindow", "Preview console output will appear here..."))
+        self.propertiesGroup.setTitle(_translate("MainWindow", "Properties"))
+        self.labelNoSelection.setText(_translate("MainWindow", "No object selected.\n"
+"\n"
+"Click an object on the canvas or right-click to edit its properties."))
+        self.labelObjName.setText(_translate("MainWindow", "Name:"))
+        self.editObjName.setPlaceholderText(_translate("MainWindow", "eq_1"))
+        self.labelLatex.setText(_translate("MainWindow", "LaTeX:"))
+        self.editLatexCode.setPlaceholderText(_translate("MainWindow", "E = mc^2"))
+        self.labelTextColor.setText(_translate("MainWindow", "Color:"))
+        self.btnTextColor.setStyleSheet(_translate("MainWindow", "background-color: #FFFFFF;"))
+        self.btnTextColor.setText(_translate("MainWindow", "#FFFFFF"))
+        self.labelFontSize.setText(_translate("MainWindow", "Font Size:"))
+        self.labelPosX.setText(_translate("MainWindow", "X:"))
+        self.labelPosY.setText(_translate("MainWindow", "Y:"))
+        self.labelShapeName.setText(_translate("MainWindow", "Name:"))
+        self.editShapeName.setPlaceholderText(_translate("MainWindow", "circle_1"))
+        self.labelShapeType.setText(_translate("MainWindow", "Type:"))
+        self.labelShapeTypeValue.setText(_translate("MainWindow", "Circle"))
+        self.labelStrokeColor.setText(_translate("MainWindow", "Stroke:"))
+        self.btnStrokeColor.setStyleSheet(_translate("MainWindow", "background-color: #FFFFFF;"))
+        self.btnStrokeColor.setText(_translate("MainWindow", "#FFFFFF"))
+        self.labelFillColor.setText(_translate("MainWindow", "Fill:"))
+        self.btnFillColor.setText(_translate("MainWindow", "None"))
+        self.labelStrokeWidth.setText(_translate("MainWindow", "Width:"))
+        self.labelRadius.setText(_translate("MainWindow", "Radius:"))
+        self.labelShapePosX.setText(_translate("MainWindow", "X:"))
+        self.labelShapePosY.setText(_translate("MainWindow", "Y:"))
+        self.labelAnimTarget.setText(_translate("MainWindow", "Target:"))
+        self.comboAnimTarget.setProperty("placeholderText", _translate("MainWindow", "Select object..."))
+        self.labelPropAnimType.setText(_translate("MainWindow", "Animation:"))
+        self.comboAnimTypeProps.setItemText(0, _translate("MainWindow", "Add"))
+        self.comboAnimTypeProps.setItemText(1, _translate("MainWindow", "Wait"))
+        self.comboAnimTypeProps.setItemText(2, _translate("MainWindow", "FadeIn"))
+        self.comboAnimTypeProps.setItemText(3, _translate("MainWindow", "FadeOut"))
+        self.comboAnimTypeProps.setItemText(4, _translate("MainWindow", "Write"))
+        self.comboAnimTypeProps.setItemText(5, _translate("MainWindow", "ShowCreation"))
+        self.comboAnimTypeProps.setItemText(6, _translate("MainWindow", "Transform"))
+        self.labelPropDuration.setText(_translate("MainWindow", "Duration:"))
+        self.spinAnimDuration.setSuffix(_translate("MainWindow", "s"))
+        self.labelEasing.setText(_translate("MainWindow", "Easing:"))
+        self.comboEasing.setItemText(0, _translate("MainWindow", "smooth"))
+        self.comboEasing.setItemText(1, _translate("MainWindow", "linear"))
+        self.comboEasing.setItemText(2, _translate("MainWindow", "rush_into"))
+        self.comboEasing.setItemText(3, _translate("MainWindow", "rush_from"))
+        self.comboEasing.setItemText(4, _translate("MainWindow", "there_and_back"))
+        self.labelSceneName.setText(_translate("MainWindow", "Name:"))
+        self.editSceneName.setPlaceholderText(_translate("MainWindow", "Scene1"))
+        self.labelSceneBgColor.setText(_translate("MainWindow", "Background:"))
+        self.btnSceneBgColor.setStyleSheet(_translate("MainWindow", "background-color: #000000;"))
+        self.btnSceneBgColor.setText(_translate("MainWindow", "#000000"))
+        self.renderGroup.setTitle(_translate("MainWindow", "Render Settings"))
+        self.labelRenderQuality.setText(_translate("MainWindow", "Quality:"))
+        self.comboRenderQuality.setItemText(0, _translate("MainWindow", "480p 15fps"))
+        self.comboRenderQuality.setItemText(1, _translate("MainWindow", "720p 30fps"))
+        self.comboRenderQuality.setItemText(2, _translate("MainWindow", "1080p 60fps"))
+        self.comboRenderQuality.setItemText(3, _translate("MainWindow", "4K 60fps"))
+        self.labelRenderFps.setText(_translate("MainWindow", "FPS:"))
+        self.labelRenderFormat.setText(_translate("MainWindow", "Format:"))
+        self.comboRenderFormat.setItemText(0, _translate("MainWindow", "mp4"))
+        self.comboRenderFormat.setItemText(1, _translate("MainWindow", "gif"))
+        self.comboRenderFormat.setItemText(2, _translate("MainWindow", "png"))
+        self.labelOutputDir.setText(_translate("MainWindow", "Output:"))
+        self.editOutputDir.setPlaceholderText(_translate("MainWindow", "Default (media/)"))
+        self.btnBrowseOutput.setText(_translate("MainWindow", "..."))
+        self.checkOpenOnComplete.setText(_translate("MainWindow", "Open on completion"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.menuEdit.setTitle(_translate("MainWindow", "Edit"))
+        self.menuView.setTitle(_translate("MainWindow", "View"))
+        self.menuHelp.setTitle(_translate("MainWindow", "Help"))
+        self.actionNew.setText(_translate("MainWindow", "New Project"))
+        self.actionNew.setShortcut(_translate("MainWindow", "Ctrl+N"))
+        self.actionOpen.setText(_translate("MainWindow", "Open (.manim)..."))
+        self.actionOpen.setShortcut(_translate("MainWindow", "Ctrl+O"))
+        self.actionSave.setText(_translate("MainWindow", "Save"))
+        self.actionSave.setShortcut(_translate("MainWindow", "Ctrl+S"))
+        self.actionSaveAs.setText(_translate("MainWindow", "Save As..."))
+        self.actionSaveAs.setShortcut(_translate("MainWindow", "Ctrl+Shift+S"))
+        self.actionExportPy.setText(_translate("MainWindow", "Export to .py"))
+        self.actionRenderVideo.setText(_translate("MainWindow", "Render to Video..."))
+        self.actionExit.setText(_translate("MainWindow", "Exit"))
+        self.actionExit.setShortcut(_translate("MainWindow", "Ctrl+Q"))
+        self.actionCopy.setText(_translate("MainWindow", "Copy"))
+        self.actionCopy.setShortcut(_translate("MainWindow", "Ctrl+C"))
+        self.actionPaste.setText(_translate("MainWindow", "Paste"))
+        self.actionPaste.setShortcut(_translate("MainWindow", "Ctrl+V"))
+        self.actionUndo.setText(_translate("MainWindow", "Undo"))
+        self.actionUndo.setShortcut(_translate("MainWindow", "Ctrl+Z"))
+        self.actionRedo.setText(_translate("MainWindow", "Redo"))
+        self.actionRedo.setShortcut(_translate("MainWindow", "Ctrl+Y"))
+        self.actionDelete.setText(_translate("MainWindow", "Delete Selected"))
+        self.actionDelete.setShortcut(_translate("MainWindow", "Del"))
+        self.actionSelectAll.setText(_translate("MainWindow", "Select All"))
+        self.actionSelectAll.setShortcut(_translate("MainWindow", "Ctrl+A"))
+        self.actionToggleScenes.setText(_translate("MainWindow", "Show Scenes Panel"))
+        self.actionToggleAnimations.setText(_translate("MainWindow", "Show Animations Panel"))
+        self.actionToggleProperties.setText(_translate("MainWindow", "Show Properties Panel"))
+        self.actionAbout.setText(_translate("MainWindow", "About Manim Composer"))
+from PyQt6.QtWidgets import QTabBar
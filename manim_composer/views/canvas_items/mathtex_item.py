@@ -1,15 +1,58 @@
 """MathTex canvas item — renders LaTeX formulas on the QGraphicsScene."""
 
+import functools
+import hashlib
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
+from collections import OrderedDict
 
+from PyQt6 import sip
 from PyQt6.QtWidgets import QGraphicsPixmapItem, QGraphicsItem
-from PyQt6.QtGui import QPixmap, QColor, QPainter, QFont, QFontMetrics
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPixmap, QColor, QPainter, QFont, QFontMetrics
+from PyQt6.QtCore import Qt, QObject, QRunnable, QStandardPaths, QThreadPool, pyqtSignal
 
 _CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
+# (latex, color, dpi) -> rendered base pixmap, least recently used first; QPixmap
+# is implicitly shared, so items built from the same formula reuse one image.
+_RENDER_CACHE: OrderedDict[tuple[str, str, int], QPixmap] = OrderedDict()
+_RENDER_CACHE_MAX = 256
+
+# dvipng resolutions used for canvas items. At 300 dpi even a short formula
+# ("x") comes out taller than 48 px, so items render at the smallest bucket
+# that stays above their display height and only ever scale down.
+_DPI_BUCKETS = (150, 300, 600)
+
+# RAM-backed scratch space for LaTeX's working files, where the OS has one
+_RAM_TMP = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Rendered PNGs persist here across sessions; "" once found unusable.
+_disk_cache_dir: str | None = None
+# Most PNGs kept on disk; the least recently used (by mtime) are pruned at startup
+_DISK_CACHE_MAX = 2000
+
+# The standalone preamble is dumped once into a LaTeX format (<_FMT_NAME>.fmt
+# in the cache dir) so each compile loads it instead of re-reading the packages.
+_PREAMBLE = (
+    "\\documentclass[preview,border=2pt]{standalone}\n"
+    "\\usepackage{amsmath,amssymb}\n"
+)
+_FMT_NAME = "mc_math"
+_fmt_lock = threading.Lock()
+_fmt_dir: str | None = None  # dir holding the format; "" once found unusable
+
+
+def dpi_for_font_size(font_size: int) -> int:
+    """Return the dvipng resolution bucket for an item *font_size* px tall."""
+    needed = 300 * font_size / 48
+    for dpi in _DPI_BUCKETS:
+        if dpi >= needed:
+            return dpi
+    return _DPI_BUCKETS[-1]
+
 
 def _latex_env():
     """Return env dict with TinyTeX on PATH (lazy import to avoid circular deps)."""
@@ -22,35 +65,190 @@ def _latex_env():
 
 def _hex_to_dvipng_fg(color_hex: str) -> str:
     """Convert '#RRGGBB' to dvipng fg spec like 'rgb 1.000 1.000 1.000'."""
+    if len(color_hex) == 7 and color_hex[0] == "#":
+        try:
+            r, g, b = bytes.fromhex(color_hex[1:])
+        except ValueError:
+            pass
+        else:
+            return f"rgb {r / 255:.3f} {g / 255:.3f} {b / 255:.3f}"
+    # Named colors and other spellings QColor understands
     c = QColor(color_hex)
     return f"rgb {c.redF():.3f} {c.greenF():.3f} {c.blueF():.3f}"
 
 
-def render_latex(latex: str, color: str = "#FFFFFF", dpi: int = 600) -> QPixmap | None:
-    """Render LaTeX to a transparent QPixmap via latex + dvipng.
+def _cache_dir() -> str:
+    """Return the persistent LaTeX cache directory, or "" if it can't be created."""
+    global _disk_cache_dir
+    if _disk_cache_dir is None:
+        base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        path = os.path.join(base or tempfile.gettempdir(), "latex_png")
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            path = ""
+        _disk_cache_dir = path
+    return _disk_cache_dir
 
-    Returns None if the LaTeX toolchain is unavailable or compilation fails.
+
+def _disk_cache_path(latex: str, color: str, dpi: int) -> str | None:
+    """Return the on-disk cache file for one rendering, or None if caching is off."""
+    cache = _cache_dir()
+    if not cache:
+        return None
+    key = f"{latex}\0{color.lower()}\0{dpi}".encode("utf-8")
+    return os.path.join(cache, hashlib.blake2b(key, digest_size=16).hexdigest() + ".png")
+
+
+def _prune_disk_cache() -> None:
+    """Delete the least recently used cached PNGs beyond _DISK_CACHE_MAX."""
+    cache = _cache_dir()
+    if not cache:
+        return
+    try:
+        with os.scandir(cache) as it:
+            entries = [
+                (e.stat().st_mtime, e.path) for e in it
+                if e.name.endswith(".png") and e.is_file()
+            ]
+    except OSError:
+        return
+    if len(entries) <= _DISK_CACHE_MAX:
+        return
+    entries.sort()
+    for _mtime, path in entries[:len(entries) - _DISK_CACHE_MAX]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _write_file(path: str, text: str) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def _ensure_format(env) -> str | None:
+    """Return the directory holding the preamble format, building it on first use."""
+    global _fmt_dir
+    with _fmt_lock:
+        if _fmt_dir is None:
+            _fmt_dir = _build_format(env)
+        return _fmt_dir or None
+
+
+def _discard_format() -> None:
+    """Stop using the format (e.g. written by another TeX version) and delete it."""
+    global _fmt_dir
+    with _fmt_lock:
+        if _fmt_dir:
+            try:
+                os.remove(os.path.join(_fmt_dir, _FMT_NAME + ".fmt"))
+            except OSError:
+                pass
+        _fmt_dir = ""
+
+
+def _build_format(env) -> str:
+    """Dump _PREAMBLE into <_FMT_NAME>.fmt in the cache dir; return the dir or ""."""
+    cache = _cache_dir()
+    if not cache:
+        return ""
+    fmt = os.path.join(cache, _FMT_NAME + ".fmt")
+    if os.path.isfile(fmt):
+        return cache
+    # Built next to its final place: the rename below must stay on one filesystem
+    with tempfile.TemporaryDirectory(dir=cache) as tmp:
+        src = os.path.join(tmp, _FMT_NAME + ".tex")
+        _write_file(src, _PREAMBLE + "\\dump\n")
+        try:
+            subprocess.run(
+                ["latex", "-ini", "-interaction=nonstopmode",
+                 f"-jobname={_FMT_NAME}", "&latex", src],
+                cwd=tmp, capture_output=True, timeout=60,
+                creationflags=_CREATE_NO_WINDOW,
+                env=env,
+            )
+            # Rename into place so a concurrent app instance never loads half a format
+            os.replace(os.path.join(tmp, _FMT_NAME + ".fmt"), fmt)
+        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+            return ""
+    return cache
+
+
+def render_latex_png(latex: str, color: str = "#FFFFFF", dpi: int = 600) -> bytes | None:
+    """Render LaTeX to transparent PNG bytes via latex + dvipng.
+
+    Results are cached on disk, so a formula seen in an earlier session skips
+    LaTeX entirely. Touches no Qt objects, so it is safe to call from a worker
+    thread. Returns None if the LaTeX toolchain is unavailable or compilation fails.
     """
-    with tempfile.TemporaryDirectory() as tmp:
+    cache_path = _disk_cache_path(latex, color, dpi)
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            pass
+        else:
+            # A hit marks the file recently used, so pruning keeps it
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return data
+    data = _compile_latex_png(latex, color, dpi)
+    if data and cache_path is not None:
+        # Unique temp name + rename: concurrent renders never expose a partial file
+        tmp = f"{cache_path}.{os.getpid()}.{id(data)}.tmp"
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+    return data
+
+
+def _compile_latex_png(latex: str, color: str, dpi: int) -> bytes | None:
+    """Run latex + dvipng for one formula (uncached)."""
+    body = (
+        "\\begin{document}\n"
+        f"\\fontsize{{28}}{{34}}\\selectfont ${latex}$\n"
+        "\\end{document}\n"
+    )
+    env = _latex_env()
+    fmt_dir = _ensure_format(env)
+    if fmt_dir:
+        data = _run_latex_dvipng(body, color, dpi, env, fmt_dir)
+        if data is not None:
+            return data
+    data = _run_latex_dvipng(_PREAMBLE + body, color, dpi, env)
+    if data is not None and fmt_dir:
+        # Compiles without the format but not with it: the format is stale
+        _discard_format()
+    return data
+
+
+def _run_latex_dvipng(source: str, color: str, dpi: int, env,
+                      fmt_dir: str | None = None) -> bytes | None:
+    """Compile *source* (with the dumped preamble format if *fmt_dir*) and convert to PNG."""
+    with tempfile.TemporaryDirectory(dir=_RAM_TMP) as tmp:
         tex = os.path.join(tmp, "f.tex")
         dvi = os.path.join(tmp, "f.dvi")
         png = os.path.join(tmp, "f1.png")
+        _write_file(tex, source)
 
-        with open(tex, "w") as fh:
-            fh.write(
-                "\\documentclass[preview,border=2pt]{standalone}\n"
-                "\\usepackage{amsmath,amssymb}\n"
-                "\\begin{document}\n"
-                f"\\fontsize{{28}}{{34}}\\selectfont ${latex}$\n"
-                "\\end{document}\n"
-            )
-
+        cmd = ["latex", "-interaction=nonstopmode", f"-output-directory={tmp}", tex]
+        if fmt_dir:
+            # Formats are looked up in the working directory
+            cmd.insert(1, f"-fmt={_FMT_NAME}")
         try:
-            env = _latex_env()
             subprocess.run(
-                ["latex", "-interaction=nonstopmode",
-                 f"-output-directory={tmp}", tex],
-                capture_output=True, timeout=30,
+                cmd, cwd=fmt_dir, capture_output=True, timeout=30,
                 creationflags=_CREATE_NO_WINDOW,
                 env=env,
             )
@@ -67,47 +265,135 @@ def render_latex(latex: str, color: str = "#FFFFFF", dpi: int = 600) -> QPixmap
                 env=env,
             )
             if os.path.isfile(png):
-                return QPixmap(png)
+                with open(png, "rb") as fh:
+                    return fh.read()
         except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
             pass
     return None
 
 
+# 1x1 transparent PNG, decoded at startup so Qt's PNG reader is loaded early
+_PREWARM_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06"
+    b"\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\x0bIDATx\x9cc`\x00\x02\x00\x00\x05"
+    b"\x00\x01z^\xab?\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+
+def prewarm_rendering() -> None:
+    """Do the one-off setup of the render path before the first formula needs it.
+
+    Loads the PNG image reader, creates the cache dir, prunes old PNGs from it
+    and builds the preamble format. Touches only QImage and the filesystem, so
+    it runs on a worker thread.
+    """
+    QImage.fromData(_PREWARM_PNG, "PNG")
+    _prune_disk_cache()
+    _ensure_format(_latex_env())
+
+
+def clear_render_caches() -> None:
+    """Drop every cached QPixmap/QFont; call before the QApplication goes away."""
+    _RENDER_CACHE.clear()
+    _render_fallback_cached.cache_clear()
+    _fallback_font.cache_clear()
+
+
+def pixmap_from_png(data: bytes | None) -> QPixmap | None:
+    """Decode PNG bytes from render_latex_png() into a QPixmap (GUI thread only)."""
+    if not data:
+        return None
+    image = QImage.fromData(data, "PNG")
+    if image.isNull():
+        return None
+    # Premultiplied ARGB is what the painter blends; convert once, here
+    image.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+    return QPixmap.fromImage(image)
+
+
+def render_latex(latex: str, color: str = "#FFFFFF", dpi: int = 600) -> QPixmap | None:
+    """Render LaTeX to a transparent QPixmap via latex + dvipng.
+
+    Returns None if the LaTeX toolchain is unavailable or compilation fails.
+    """
+    return pixmap_from_png(render_latex_png(latex, color, dpi))
+
+
+class _TexRenderSignals(QObject):
+    """Signal holder for TexRenderTask (QRunnable is not a QObject)."""
+
+    ready = pyqtSignal(object)  # PNG bytes, or None on failure
+
+
+class TexRenderTask(QRunnable):
+    """Compile a LaTeX formula to PNG bytes on a QThreadPool worker."""
+
+    def __init__(self, latex: str, color: str, dpi: int = 600):
+        super().__init__()
+        self.latex = latex
+        self.color = color
+        self.dpi = dpi
+        self.signals = _TexRenderSignals()
+
+    def run(self):
+        # Queued back to the GUI thread, where the QPixmap is built
+        self.signals.ready.emit(render_latex_png(self.latex, self.color, self.dpi))
+
+
 def render_fallback(latex: str, color: str = "#FFFFFF", size: int = 36) -> QPixmap:
     """Render LaTeX source as styled text (fallback when LaTeX is not installed)."""
+    # A new handle onto the shared cached image; QPixmap copies on write
+    return QPixmap(_render_fallback_cached(latex, color, size))
+
+
+@functools.lru_cache(maxsize=None)
+def _fallback_font(size: int) -> tuple[QFont, QFontMetrics]:
+    """Return the fallback font for *size* and its metrics (few distinct sizes)."""
     font = QFont("Cambria Math", size)
     font.setItalic(True)
-    metrics = QFontMetrics(font)
+    return font, QFontMetrics(font)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_fallback_cached(latex: str, color: str, size: int) -> QPixmap:
+    font, metrics = _fallback_font(size)
     text = f" {latex} "
-    rect = metrics.boundingRect(text)
+    # Advance width and line height are enough: the text is space-padded anyway
     pad = 8
-    pixmap = QPixmap(rect.width() + pad * 2, rect.height() + pad * 2)
-    pixmap.fill(Qt.GlobalColor.transparent)
+    # Paint into a plain ARGB32 image, then convert once
+    image = QImage(metrics.horizontalAdvance(text) + pad * 2, metrics.height() + pad * 2,
+                   QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
 
-    p = QPainter(pixmap)
+    p = QPainter(image)
     p.setRenderHint(QPainter.RenderHint.TextAntialiasing)
     p.setFont(font)
     p.setPen(QColor(color))
-    p.drawText(pad - rect.x(), pad - rect.y(), text)
+    p.drawText(pad, pad + metrics.ascent(), text)
     p.end()
-    return pixmap
+    return QPixmap.fromImage(image)
 
 
 class MathTexItem(QGraphicsPixmapItem):
     """Displays a rendered LaTeX formula on the canvas."""
 
-    _latex_available = None  # None = untested, True/False after first attempt
+    _latex_available = None  # None = not probed yet; else whether latex/dvipng are on PATH
 
     # font_size=48 maps to 0.48 manim units tall — matches ManimGL's default Tex height.
     _BASE_FONT_SIZE = 48
 
     def __init__(self, latex: str = "F=ma", color: str = "#FFFFFF",
-                 font_size: int = 48, parent=None):
+                 font_size: int = 48, parent=None,
+                 base_pixmap: QPixmap | None = None, base_dpi: int | None = None):
         super().__init__(parent)
         self.latex = latex
         self.color = color
         self.font_size = font_size
         self._base_pixmap: QPixmap | None = None
+        # Resolution the base pixmap was rendered at; None for the text fallback
+        self._base_dpi: int | None = None
+        # In-flight LaTeX render; results from superseded renders are dropped
+        self._render_task: TexRenderTask | None = None
 
         self.setFlags(
             QGraphicsItem.GraphicsItemFlag.ItemIsSelectable
@@ -116,7 +402,14 @@ class MathTexItem(QGraphicsPixmapItem):
         )
         self.setCursor(Qt.CursorShape.SizeAllCursor)
         self.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
-        self._do_render()
+        if base_pixmap is not None:
+            # Already rendered elsewhere (e.g. on a worker thread); base_dpi is
+            # the LaTeX render's dpi, or None if it is the text fallback
+            self._base_pixmap = base_pixmap
+            self._base_dpi = base_dpi
+            self._apply_pixmap()
+        else:
+            self._do_render()
 
     def set_latex(self, latex: str):
         self.latex = latex
@@ -127,19 +420,69 @@ class MathTexItem(QGraphicsPixmapItem):
         self._do_render()
 
     def set_font_size(self, size: int):
-        """Update the displayed size without re-rendering LaTeX."""
+        """Update the displayed size; re-render LaTeX only if it would have to scale up."""
         self.font_size = size
-        if self._base_pixmap is not None:
+        if self._base_dpi is not None and dpi_for_font_size(size) > self._base_dpi:
+            self._do_render()
+        elif self._base_pixmap is not None:
             self._apply_pixmap()
 
+    @classmethod
+    def refresh_availability(cls) -> bool:
+        """Probe PATH for latex and dvipng (e.g. after TinyTeX is installed)."""
+        env = _latex_env()
+        path = (env or os.environ).get("PATH")
+        cls._latex_available = bool(
+            shutil.which("latex", path=path) and shutil.which("dvipng", path=path)
+        )
+        return cls._latex_available
+
+    @property
+    def render_pending(self) -> bool:
+        """True while the shown pixmap is a placeholder for an in-flight LaTeX render."""
+        return self._render_task is not None
+
     def _do_render(self):
-        """Compile LaTeX (or fall back) and store the high-res base pixmap."""
-        pm = None
-        if MathTexItem._latex_available is not False:
-            pm = render_latex(self.latex, self.color)
-            MathTexItem._latex_available = pm is not None
+        """Show the cached base pixmap, or a placeholder while LaTeX compiles off-thread."""
+        self._render_task = None
+        dpi = dpi_for_font_size(self.font_size)
+        key = (self.latex, self.color, dpi)
+        pm = _RENDER_CACHE.get(key)
+        if pm is not None:
+            _RENDER_CACHE.move_to_end(key)
+            self._base_dpi = dpi
+        else:
+            if MathTexItem._latex_available is None:
+                MathTexItem.refresh_availability()
+            if MathTexItem._latex_available:
+                task = TexRenderTask(self.latex, self.color, dpi)
+                task.signals.ready.connect(lambda png: self._on_render_ready(task, key, png))
+                self._render_task = task  # keeps the signal holder alive
+                QThreadPool.globalInstance().start(task)
+            # Keep showing the previous rendering while a new one compiles
+            if self._base_pixmap is not None and self._render_task is not None:
+                return
+            pm = render_fallback(self.latex, self.color)
+            self._base_dpi = None
+        self._base_pixmap = pm
+        self._apply_pixmap()
+
+    def _on_render_ready(self, task: TexRenderTask, key: tuple[str, str, int], png):
+        """Swap in a finished render, unless the formula or color changed meanwhile."""
+        # A failed compile (e.g. a formula typo) only affects this item
+        pm = pixmap_from_png(png)
+        if pm is not None:
+            if len(_RENDER_CACHE) >= _RENDER_CACHE_MAX:
+                _RENDER_CACHE.popitem(last=False)  # evict the least recently used
+            _RENDER_CACHE[key] = pm
+        if task is not self._render_task or sip.isdeleted(self):
+            return
+        self._render_task = None
         if pm is None:
             pm = render_fallback(self.latex, self.color)
+            self._base_dpi = None
+        else:
+            self._base_dpi = task.dpi
         self._base_pixmap = pm
         self._apply_pixmap()
 
@@ -147,7 +490,7 @@ class MathTexItem(QGraphicsPixmapItem):
         """Scale the stored base pixmap to font_size pixels tall and set it."""
         pm = self._base_pixmap
         target_h = max(4, self.font_size)
-        if pm.height() != target_h:
+        if abs(pm.height() - target_h) > 1:
             pm = pm.scaledToHeight(target_h, Qt.TransformationMode.SmoothTransformation)
         self.setPixmap(pm)
         self.setOffset(-pm.width() / 2, -pm.height() / 2)
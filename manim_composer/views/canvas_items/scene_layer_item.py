@@ -0,0 +1,25 @@
+"""Scene layer — invisible parent for all canvas items of one scene."""
+
+from PyQt6.QtWidgets import QGraphicsItem
+from PyQt6.QtCore import QRectF
+
+
+class SceneLayerItem(QGraphicsItem):
+    """Content-less parent item at the scene origin.
+
+    Each composer scene parents its items to one layer, so switching scenes
+    is a single setVisible() on the layer instead of one per item. The layer
+    sits at (0, 0) with no transform, so children's pos() stays in canvas
+    coordinates, and it is not selectable or movable, so children keep their
+    own selection and drag behaviour.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents)
+
+    def boundingRect(self) -> QRectF:
+        return QRectF()
+
+    def paint(self, painter, option, widget=None):
+        pass
@@ -0,0 +1,63 @@
+"""Tests for the Python syntax highlighter's multi-line string handling."""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QTextDocument
+from PyQt6.QtWidgets import QApplication
+
+from manim_composer.syntax_highlighter import PythonHighlighter
+
+_STRING = "#e6db74"
+_COMMENT = "#75715e"
+
+_app = QApplication.instance() or QApplication([])
+
+
+def _formats(source: str) -> list[list[tuple[int, int, str]]]:
+    """Highlight *source* and return (start, length, color) runs per line."""
+    doc = QTextDocument()
+    doc.setPlainText(source)
+    highlighter = PythonHighlighter(doc)
+    highlighter.rehighlight()
+    lines = []
+    block = doc.begin()
+    while block.isValid():
+        lines.append([
+            (r.start, r.length, r.format.foreground().color().name())
+            for r in block.layout().formats()
+        ])
+        block = block.next()
+    return lines
+
+
+class TripleQuoteTests(unittest.TestCase):
+    def test_triple_quote_in_comment_does_not_open_a_string(self):
+        lines = _formats('x = 1  # a """ in a comment\ny = 2\n')
+        self.assertIn((7, 20, _COMMENT), lines[0])
+        self.assertNotIn(_STRING, [color for _s, _l, color in lines[1]])
+
+    def test_triple_quote_in_string_does_not_open_a_string(self):
+        lines = _formats("z = '\"\"\"'\nw = 3\n")
+        self.assertEqual(lines[0], [(4, 5, _STRING)])
+        self.assertNotIn(_STRING, [color for _s, _l, color in lines[1]])
+
+    def test_multiline_string_spans_blocks(self):
+        lines = _formats('s = """doc\nstill # doc\nend""" ; x = 1  # c\n')
+        self.assertEqual(lines[0], [(4, 6, _STRING)])
+        self.assertEqual(lines[1], [(0, 11, _STRING)])
+        self.assertIn((0, 6, _STRING), lines[2])
+        self.assertIn((16, 3, _COMMENT), lines[2])
+
+    def test_inline_triple_string_leaves_rest_of_line(self):
+        lines = _formats("s = '''a''' + '''b'''  # c\nt = 1\n")
+        self.assertEqual(
+            lines[0], [(4, 7, _STRING), (14, 7, _STRING), (23, 3, _COMMENT)],
+        )
+        self.assertNotIn(_STRING, [color for _s, _l, color in lines[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()